@@ -3,30 +3,205 @@
 CDE API Client for health checks, dataset upload, and datapoint management
 """
 
-import csv
-from io import StringIO
+import gzip
+import hashlib
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
+import json_utils
 from console_utils import print_info, print_success, print_error, print_data, print_warning
 
 
+__all__ = ["CDEApiClient"]
+
+CSV_HEADER = ("measurement", "timestamp", "value", "unit", "timeseries")
+
+_CSV_HEADER_LINE = ",".join(CSV_HEADER) + "\r\n"
+
+_core_fields = itemgetter("measurement", "timestamp", "value", "unit")
+
+
+_TIMESERIES_KEYS = ("timeseries", "timeseries_id", "timeseriesId")
+
+
+def _csv_rows(datapoints: List[Dict[str, Any]]) -> Tuple[List[tuple], int]:
+    """
+    Validate datapoints and convert them to CSV row tuples in a single pass
+
+    Datapoints coming from one transform share the same keys, so the schema
+    of the first datapoint is checked once and the rest are extracted with a
+    single itemgetter. Any KeyError, missing value or empty timeseries id
+    falls back to the per-row validation below.
+
+    Args:
+        datapoints: List of datapoint dictionaries
+
+    Returns:
+        Tuple of (rows, missing) where missing counts datapoints skipped
+        because of missing fields
+    """
+    if datapoints:
+        first = datapoints[0]
+        ts_key = next((key for key in _TIMESERIES_KEYS if first.get(key)), None)
+        if ts_key is not None:
+            row_fields = itemgetter("measurement", "timestamp", "value", "unit", ts_key)
+            try:
+                rows = list(map(row_fields, datapoints))
+            except KeyError:
+                rows = None
+            # Same test as the per-row path: falsy timeseries ids (e.g. "")
+            # and None core fields are skipped and counted there
+            if rows is not None and not any(None in row or not row[4] for row in rows):
+                return rows, 0
+
+    rows = []
+    append = rows.append
+    missing = 0
+
+    for datapoint in datapoints:
+        try:
+            core = _core_fields(datapoint)
+        except KeyError:
+            missing += 1
+            continue
+
+        timeseries_id = (
+            datapoint.get("timeseries")
+            or datapoint.get("timeseries_id")
+            or datapoint.get("timeseriesId")
+        )
+
+        if timeseries_id is None or None in core:
+            missing += 1
+            continue
+
+        append((*core, timeseries_id))
+
+    return rows, missing
+
+
+def _encode_csv(rows: List[tuple]) -> bytes:
+    """
+    Encode CSV rows (with header) as UTF-8 bytes
+
+    Rows are formatted with a plain join, which matches csv.writer output
+    byte for byte as long as no field needs quoting. The join is checked for
+    extra delimiters, quotes or line breaks and falls back to csv.writer
+    when any field contains them.
+
+    Args:
+        rows: Row tuples as returned by _csv_rows
+
+    Returns:
+        CSV document as bytes
+    """
+    body = "".join([f"{m},{t},{v},{u},{ts}\r\n" for m, t, v, u, ts in rows])
+    count = len(rows)
+
+    if (body.count(",") == 4 * count and body.count("\n") == count
+            and body.count("\r") == count and '"' not in body):
+        return (_CSV_HEADER_LINE + body).encode("utf-8")
+
+    # Only needed for fields that require quoting, so keep it off the import path
+    import csv
+    from io import StringIO
+
+    csv_buffer = StringIO(newline='')
+    writer = csv.writer(csv_buffer)
+    writer.writerow(CSV_HEADER)
+    writer.writerows(rows)
+    return csv_buffer.getvalue().encode("utf-8")
+
+
+class _JitteredRetry(Retry):
+    """Retry policy that adds random jitter on top of the exponential backoff"""
+
+    def get_backoff_time(self) -> float:
+        base = super().get_backoff_time()
+        return base + random.uniform(0, 0.5) * base
+
+
 class CDEApiClient:
     """Client for interacting with the CDE Internal API"""
+
+    # Keep-alive connections kept per host; sized for concurrent batch uploads
+    POOL_SIZE = 32
+    # Default number of concurrent CSV batch uploads
+    UPLOAD_WORKERS = 8
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, compress_uploads: bool = False,
+                 upload_workers: Optional[int] = None, timeseries_ttl: float = 300):
         """
         Initialize the CDE API client
         
         Args:
             base_url: Base URL of the CDE Internal API
+            compress_uploads: Gzip CSV batch uploads (the CDE must accept
+                Content-Encoding: gzip on the uploaded file part)
+            upload_workers: Concurrent CSV batch uploads (defaults to UPLOAD_WORKERS)
+            timeseries_ttl: Seconds get_timeseries results are reused (0 disables caching)
         """
         self.base_url = base_url.rstrip('/')
+        self.compress_uploads = compress_uploads
+        self.upload_workers = max(1, upload_workers or self.UPLOAD_WORKERS)
+        self.timeseries_ttl = timeseries_ttl
+        # (dataset_id, dataset_name) -> (time.monotonic(), timeseries list)
+        self._timeseries_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[float, List[Dict[str, Any]]]] = {}
+        # Content digests of CSV batches this client uploaded successfully, and
+        # of batches still in flight (resolved with whether the upload succeeded)
+        self._uploaded_batches: Set[str] = set()
+        self._pending_batches: Dict[str, Future] = {}
+        self._uploaded_lock = threading.Lock()
+
+        # Endpoint URLs are fixed for the lifetime of the client
+        base = self.base_url + '/'
+        self._health_url = urljoin(base, 'api/health')
+        self._dataset_url = urljoin(base, 'api/dataset')
+        self._dataset_prefix = urljoin(base, 'api/dataset/')
+        self._timeseries_url = urljoin(base, 'api/timeseries')
+        self._timeseries_csv_url = urljoin(base, 'api/timeseries/csv')
+
         self.session = requests.Session()
+        # Retry transient failures; the final response is still returned
+        # (raise_on_status=False) so callers keep reporting the status code
+        retry = _JitteredRetry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'POST', 'DELETE'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # Every upload worker needs its own keep-alive connection
+        pool_size = max(self.POOL_SIZE, self.upload_workers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=False,
+            max_retries=retry
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         # Note: Don't set Content-Type globally as it interferes with multipart/form-data
+        self.session.headers.update({'Accept': 'application/json'})
+    
+    def close(self):
+        """
+        Close the HTTP session and its keep-alive connections
+        """
+        self.session.close()
     
     def check_health(self) -> Dict[str, Any]:
         """
@@ -35,17 +210,16 @@ class CDEApiClient:
         Returns:
             Health status dictionary or None if unreachable
         """
-        health_url = urljoin(self.base_url + '/', 'api/health')
+        health_url = self._health_url
         
         try:
             print_info("Checking CDE API health...")
             response = self.session.get(
-                health_url, 
-                timeout=10,
-                headers={'Content-Type': 'application/json'}
+                health_url,
+                timeout=10
             )
             
-            health_data = response.json()
+            health_data = json_utils.response_json(response)
             
             if response.status_code == 200:
                 print_success("✓ CDE API is healthy")
@@ -70,7 +244,7 @@ class CDEApiClient:
         Returns:
             Response data from CDE API or None if failed
         """
-        upload_url = urljoin(self.base_url + '/', 'api/dataset')
+        upload_url = self._dataset_url
         
         try:
             print_info(f"Uploading dataset: {dataset_file_path}")
@@ -94,8 +268,10 @@ class CDEApiClient:
             
             if response.status_code in [200, 201]:  # Accept both 200 OK and 201 Created
                 print_success("✓ Dataset uploaded successfully to CDE")
+                # New timeseries may now match cached name filters
+                self._timeseries_cache.clear()
                 try:
-                    upload_data = response.json()
+                    upload_data = json_utils.response_json(response)
                     return upload_data
                 except:
                     # If response is not JSON, return a success indicator
@@ -119,18 +295,17 @@ class CDEApiClient:
         Returns:
             List of dataset dictionaries or None if failed
         """
-        datasets_url = urljoin(self.base_url + '/', 'api/dataset')
+        datasets_url = self._dataset_url
         
         try:
             print_info("Fetching datasets from CDE...")
             response = self.session.get(
                 datasets_url,
-                timeout=30,
-                headers={'Content-Type': 'application/json'}
+                timeout=30
             )
             
             if response.status_code == 200:
-                datasets = response.json()
+                datasets = json_utils.response_json(response)
                 print_success(f"✓ Retrieved {len(datasets)} datasets")
                 return datasets
             else:
@@ -152,7 +327,7 @@ class CDEApiClient:
         Returns:
             True if successful, False otherwise
         """
-        delete_url = urljoin(self.base_url + '/', f'api/dataset/{dataset_id}')
+        delete_url = self._dataset_prefix + dataset_id
         
         try:
             print_info(f"Deleting dataset: {dataset_id}")
@@ -165,11 +340,12 @@ class CDEApiClient:
             
             if response.status_code in [200, 204]:  # Accept 200 OK or 204 No Content
                 print_success("✓ Dataset deleted successfully")
+                self._timeseries_cache.clear()
                 return True
             else:
                 print_error(f"✗ Dataset deletion failed with status {response.status_code}")
                 try:
-                    error_data = response.json()
+                    error_data = json_utils.response_json(response)
                     print_data("Response content", error_data, 1)
                 except:
                     print_data("Response content", response.text, 1)
@@ -179,40 +355,56 @@ class CDEApiClient:
             print_error(f"✗ Dataset deletion failed: {e}")
             return False
     
-    def get_timeseries(self, dataset_id: str = None, dataset_name: str = None) -> List[Dict[str, Any]]:
+    def get_timeseries(self, dataset_id: str = None, dataset_name: str = None,
+                       quiet: bool = False) -> List[Dict[str, Any]]:
         """
         Get timeseries from CDE, optionally filtered by dataset ID or name
         
         Args:
             dataset_id: Optional dataset ID to filter timeseries (preferred)
             dataset_name: Optional dataset name to filter timeseries (fallback)
+            quiet: Skip progress output, e.g. when called from a worker thread
+                whose output would interleave with the caller's. Errors are
+                always printed.
             
         Returns:
             List of timeseries data or None if failed
         """
-        timeseries_url = urljoin(self.base_url + '/', 'api/timeseries')
+        timeseries_url = self._timeseries_url
+        
+        cache_key = (dataset_id, dataset_name)
+        cached = self._timeseries_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.timeseries_ttl:
+            if not quiet:
+                print_info(f"Using {len(cached[1])} cached timeseries (cache hit)")
+            return list(cached[1])
         
         try:
-            print_info("Fetching timeseries from CDE...")
-            
             params = {}
             if dataset_id:
                 params['dataset_id'] = dataset_id
-                print_data("Dataset ID filter", dataset_id, 1)
             elif dataset_name:
                 params['dataset'] = dataset_name
-                print_data("Dataset name filter", dataset_name, 1)
+            
+            if not quiet:
+                print_info("Fetching timeseries from CDE...")
+                if dataset_id:
+                    print_data("Dataset ID filter", dataset_id, 1)
+                elif dataset_name:
+                    print_data("Dataset name filter", dataset_name, 1)
             
             response = self.session.get(
                 timeseries_url,
                 params=params,
-                timeout=30,
-                headers={'Content-Type': 'application/json'}
+                timeout=30
             )
             
             if response.status_code == 200:
-                timeseries_data = response.json()
-                print_success(f"✓ Retrieved {len(timeseries_data)} timeseries")
+                timeseries_data = json_utils.response_json(response)
+                if not quiet:
+                    print_success(f"✓ Retrieved {len(timeseries_data)} timeseries")
+                if self.timeseries_ttl > 0 and isinstance(timeseries_data, list):
+                    self._timeseries_cache[cache_key] = (time.monotonic(), list(timeseries_data))
                 return timeseries_data
             else:
                 print_error(f"✗ Failed to get timeseries with status {response.status_code}")
@@ -226,6 +418,9 @@ class CDEApiClient:
     def add_datapoint(self, measurement: str, unit: str, value: float, timestamp: str, timeseries_id: str) -> bool:
         """
         Add a single datapoint to a timeseries
+
+        Goes through the same CSV bulk endpoint as add_datapoints_batch, so
+        there is a single upload path for datapoints.
         
         Args:
             measurement: Name of the measurement (e.g., "consumedEnergy")
@@ -237,8 +432,6 @@ class CDEApiClient:
         Returns:
             True if successful, False otherwise
         """
-        datapoint_url = urljoin(self.base_url + '/', 'api/timeseries')
-        
         datapoint = {
             "measurement": measurement,
             "unit": unit,
@@ -246,25 +439,11 @@ class CDEApiClient:
             "timestamp": timestamp,
             "timeseries": timeseries_id
         }
-        
-        try:
-            response = self.session.post(
-                datapoint_url,
-                json=datapoint,
-                timeout=30,
-                headers={'Content-Type': 'application/json'}
-            )
-            
-            if response.status_code in [200, 201]:
-                return True
-            else:
-                print_error(f"✗ Failed to add datapoint with status {response.status_code}")
-                print_data("Response content", response.text[:200], 1)
-                return False
-                
-        except requests.exceptions.RequestException as e:
-            print_error(f"✗ Failed to add datapoint: {e}")
-            return False
+
+        # An explicit single add is always sent, even if the same point was uploaded before
+        total_success, _, _ = self._upload_csv_batches([datapoint], batch_size=1,
+                                                       skip_duplicates=False)
+        return total_success == 1
     
     def add_datapoints_batch(self, datapoints: List[Dict[str, Any]], batch_size: int = 1000,
                             dataset_name: str = "unknown", start_date: str = None, end_date: str = None) -> Dict[str, int]:
@@ -280,12 +459,12 @@ class CDEApiClient:
             end_date: End date string for filename (e.g., "2025-05-02")
 
         Returns:
-            Dictionary with success/failure counts
+            Dictionary with success/failure counts; "duplicates" counts datapoints in
+            batches skipped because this client already uploaded identical ones
         """
         if not datapoints:
-            return {"success": 0, "failed": 0, "total": 0}
+            return {"success": 0, "failed": 0, "duplicates": 0, "total": 0}
 
-        upload_url = urljoin(self.base_url + '/', 'api/timeseries/csv')
         print_info(f"Uploading {len(datapoints)} datapoints in CSV batches of {batch_size}")
 
         # Create CSV directory inside datasets folder
@@ -307,31 +486,8 @@ class CDEApiClient:
 
         # Save one CSV file per measurement type (timeseries)
         for measurement_type, measurement_datapoints in datapoints_by_measurement.items():
-            csv_buffer = StringIO()
-            writer = csv.writer(csv_buffer)
-            writer.writerow(["measurement", "timestamp", "value", "unit", "timeseries"])
-
-            for datapoint in measurement_datapoints:
-                measurement = datapoint.get("measurement")
-                timestamp = datapoint.get("timestamp")
-                value = datapoint.get("value")
-                unit = datapoint.get("unit")
-                timeseries_id = (
-                    datapoint.get("timeseries")
-                    or datapoint.get("timeseries_id")
-                    or datapoint.get("timeseriesId")
-                )
-
-                if None not in (measurement, timestamp, value, unit, timeseries_id):
-                    writer.writerow([
-                        measurement,
-                        timestamp,
-                        value,
-                        unit,
-                        timeseries_id,
-                    ])
-
-            csv_content = csv_buffer.getvalue()
+            rows, _ = _csv_rows(measurement_datapoints)
+            csv_content = _encode_csv(rows)
 
             # Create filename with dataset name, measurement type, and date range
             date_range = ""
@@ -344,99 +500,189 @@ class CDEApiClient:
             csv_file_path = csv_dir / csv_filename
 
             try:
-                with open(csv_file_path, 'w', encoding='utf-8') as f:
+                with open(csv_file_path, 'wb') as f:
                     f.write(csv_content)
                 print_success(f"✓ Saved complete timeseries CSV to: {csv_filename}")
                 print_data("Datapoints in file", str(len(measurement_datapoints)), 2)
             except Exception as e:
                 print_error(f"✗ Failed to save CSV file: {e}")
 
-        # Now upload in batches (existing logic)
+        total_success, total_failed, total_duplicates = self._upload_csv_batches(datapoints, batch_size)
+
+        if total_success:
+            print_success(f"✓ Successfully added {total_success} datapoints via CSV")
+        if total_duplicates:
+            print_warning(f"⚠ Skipped {total_duplicates} datapoints in batches already uploaded")
+        if total_failed:
+            print_error(f"✗ Failed to add {total_failed} datapoints via CSV")
+
+        return {"success": total_success, "failed": total_failed,
+                "duplicates": total_duplicates, "total": len(datapoints)}
+
+    def _upload_csv_batches(self, datapoints: List[Dict[str, Any]], batch_size: int,
+                            skip_duplicates: bool = True) -> Tuple[int, int, int]:
+        """
+        Upload datapoints to the CSV bulk endpoint in concurrent batches
+
+        Args:
+            datapoints: List of datapoint dictionaries
+            batch_size: Number of datapoints to include per CSV upload batch
+            skip_duplicates: Skip batches identical to one this client already uploaded
+
+        Returns:
+            Tuple of (successful, failed, duplicate) datapoint counts
+        """
         total_success = 0
         total_failed = 0
-
+        total_duplicates = 0
         total_batches = (len(datapoints) + batch_size - 1) // batch_size
 
+        # Uploads start as soon as each batch is serialized; map() yields
+        # results in batch order so the log stays readable
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as executor:
+            batches = self._iter_csv_batches(datapoints, batch_size, total_batches)
+            results = executor.map(
+                partial(self._post_csv_batch, skip_duplicates=skip_duplicates), batches
+            )
+            for batch_index, rows_written, missing_fields, response, error in results:
+                total_failed += missing_fields
+
+                if error is not None:
+                    print_error(f"✗ CSV upload failed for batch {batch_index + 1}: {error}")
+                    total_failed += rows_written
+                elif response is None:
+                    total_duplicates += rows_written
+                    print_info(f"Skipping duplicate batch {batch_index + 1} (already uploaded)")
+                elif response.status_code in (200, 201):
+                    total_success += rows_written
+                    print_data(f"Batch {batch_index + 1} status", f"Uploaded {rows_written} datapoints", 1)
+                else:
+                    total_failed += rows_written
+                    print_error(
+                        f"✗ Batch {batch_index + 1} failed with status {response.status_code}"
+                    )
+                    print_data("Response content", response.text[:500], 1)
+
+        return total_success, total_failed, total_duplicates
+
+    def _iter_csv_batches(self, datapoints: List[Dict[str, Any]], batch_size: int,
+                          total_batches: int) -> Iterator[Tuple[int, bytes, int, int]]:
+        """
+        Serialize datapoints into CSV upload batches
+
+        Args:
+            datapoints: List of datapoint dictionaries
+            batch_size: Number of datapoints per batch
+            total_batches: Total number of batches (for progress output)
+
+        Yields:
+            Tuples of (batch_index, csv_bytes, rows_written, missing_fields)
+        """
         for batch_index in range(total_batches):
             start = batch_index * batch_size
-            end = start + batch_size
-            batch = datapoints[start:end]
+            batch = datapoints[start:start + batch_size]
 
             print_info(
                 f"Uploading batch {batch_index + 1}/{total_batches} ({len(batch)} datapoints)"
             )
 
-            csv_buffer = StringIO()
-            writer = csv.writer(csv_buffer)
-            writer.writerow(["measurement", "timestamp", "value", "unit", "timeseries"])
-
-            missing_fields = 0
-            rows_written = 0
-            for datapoint in batch:
-                measurement = datapoint.get("measurement")
-                timestamp = datapoint.get("timestamp")
-                value = datapoint.get("value")
-                unit = datapoint.get("unit")
-                timeseries_id = (
-                    datapoint.get("timeseries")
-                    or datapoint.get("timeseries_id")
-                    or datapoint.get("timeseriesId")
-                )
-
-                if None in (measurement, timestamp, value, unit, timeseries_id):
-                    missing_fields += 1
-                    continue
-
-                writer.writerow([
-                    measurement,
-                    timestamp,
-                    value,
-                    unit,
-                    timeseries_id,
-                ])
-                rows_written += 1
+            rows, missing_fields = _csv_rows(batch)
 
             if missing_fields:
                 print_warning(
                     f"⚠ Skipped {missing_fields} datapoints in batch due to missing fields"
                 )
-                total_failed += missing_fields
 
-            csv_content_bytes = csv_buffer.getvalue().encode("utf-8")
+            yield batch_index, _encode_csv(rows), len(rows), missing_fields
 
+    def _post_csv_batch(self, batch: Tuple[int, bytes, int, int], skip_duplicates: bool = True
+                        ) -> Tuple[int, int, int, Optional[requests.Response], Optional[Exception]]:
+        """
+        POST a single serialized CSV batch (runs in a worker thread)
+
+        With skip_duplicates, a batch identical to one this client already uploaded
+        successfully returns neither a response nor an error. If an identical batch
+        is still in flight, its outcome is awaited first; when it failed, this
+        batch is sent instead.
+
+        Args:
+            batch: Tuple of (batch_index, csv_bytes, rows_written, missing_fields)
+            skip_duplicates: Skip batches this client already uploaded
+
+        Returns:
+            Tuple of (batch_index, rows_written, missing_fields, response, error)
+        """
+        batch_index, csv_bytes, rows_written, missing_fields = batch
+        if not skip_duplicates:
+            return self._send_csv_batch(batch)
+
+        digest = hashlib.blake2b(csv_bytes, digest_size=16).hexdigest()
+        while True:
+            with self._uploaded_lock:
+                if digest in self._uploaded_batches:
+                    return batch_index, rows_written, missing_fields, None, None
+                pending = self._pending_batches.get(digest)
+                if pending is None:
+                    upload = self._pending_batches[digest] = Future()
+                    break
+            # Wait for the identical in-flight upload, then check again
+            pending.result()
+
+        succeeded = False
+        try:
+            result = self._send_csv_batch(batch)
+            response, error = result[3], result[4]
+            succeeded = error is None and response.status_code in (200, 201)
+            return result
+        finally:
+            with self._uploaded_lock:
+                if succeeded:
+                    self._uploaded_batches.add(digest)
+                del self._pending_batches[digest]
+            upload.set_result(succeeded)
+
+    def _send_csv_batch(self, batch: Tuple[int, bytes, int, int]
+                        ) -> Tuple[int, int, int, Optional[requests.Response], Optional[Exception]]:
+        """
+        Send a single serialized CSV batch to the CSV bulk endpoint
+
+        Args:
+            batch: Tuple of (batch_index, csv_bytes, rows_written, missing_fields)
+
+        Returns:
+            Tuple of (batch_index, rows_written, missing_fields, response, error)
+        """
+        batch_index, csv_bytes, rows_written, missing_fields = batch
+        filename = f"datapoints_batch_{batch_index + 1}.csv"
+
+        if self.compress_uploads:
+            # Level 1 is cheap on CPU and already shrinks the repetitive CSV several times
             files = {
                 "file": (
-                    f"datapoints_batch_{batch_index + 1}.csv",
-                    csv_content_bytes,
+                    filename + ".gz",
+                    gzip.compress(csv_bytes, compresslevel=1),
                     "text/csv",
+                    {"Content-Encoding": "gzip"},
                 )
             }
-
-            try:
-                response = self.session.post(
-                    upload_url,
-                    files=files,
-                    timeout=60,
-                )
-            except requests.exceptions.RequestException as error:
-                print_error(f"✗ CSV upload failed for batch {batch_index + 1}: {error}")
-                total_failed += rows_written
-                continue
-
-            if response.status_code in (200, 201):
-                batch_success = rows_written
-                total_success += batch_success
-                print_data("Batch status", f"Uploaded {batch_success} datapoints", 1)
-            else:
-                total_failed += rows_written
-                print_error(
-                    f"✗ Batch {batch_index + 1} failed with status {response.status_code}"
+        else:
+            files = {
+                "file": (
+                    filename,
+                    csv_bytes,
+                    "text/csv",
                 )
-                print_data("Response content", response.text[:500], 1)
+            }
 
-        if total_success:
-            print_success(f"✓ Successfully added {total_success} datapoints via CSV")
-        if total_failed:
-            print_error(f"✗ Failed to add {total_failed} datapoints via CSV")
+        try:
+            # Same key on every retry of this batch so the server can dedupe
+            response = self.session.post(
+                self._timeseries_csv_url,
+                files=files,
+                headers={"Idempotency-Key": str(uuid.uuid4())},
+                timeout=60,
+            )
+        except requests.exceptions.RequestException as error:
+            return batch_index, rows_written, missing_fields, None, error
 
-        return {"success": total_success, "failed": total_failed, "total": len(datapoints)}
+        return batch_index, rows_written, missing_fields, response, None
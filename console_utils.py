@@ -5,8 +5,11 @@ Console utilities for colored output and user input handling
 
 import json
 import os
-from datetime import date, datetime
-from typing import Any, Dict
+import sys
+from datetime import date
+from typing import Any, Dict, Iterable, List, Tuple
+
+import json_utils
 
 
 class Colors:
@@ -33,64 +36,154 @@ class Colors:
     BG_BLUE = "\033[104m"
 
 
+def _colors_enabled() -> bool:
+    """Whether ANSI colors should be emitted (honours NO_COLOR and non-TTY stdout)"""
+    if "NO_COLOR" in os.environ:
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+# Disable colors before the templates below are built from them
+if not _colors_enabled():
+    for name in [attr for attr in vars(Colors) if attr.isupper()]:
+        setattr(Colors, name, "")
+    del name
+
+
+# Decorated templates are built once; each helper only formats the variable part
+_RULE_LINE = f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.RESET}"
+_HEADER_FMT = f"{Colors.BOLD}{Colors.CYAN}  %s{Colors.RESET}"
+_SECTION_FMT = f"{Colors.BOLD}{Colors.BLUE}>> %s{Colors.RESET}"
+_SECTION_RULE = f"{Colors.GRAY}{'-'*50}{Colors.RESET}"
+_SUCCESS_FMT = f"{Colors.GREEN}[SUCCESS] %s{Colors.RESET}"
+_ERROR_FMT = f"{Colors.RED}[ERROR] %s{Colors.RESET}"
+_WARNING_FMT = f"{Colors.YELLOW}[WARNING] %s{Colors.RESET}"
+_INFO_FMT = f"{Colors.CYAN}[INFO] %s{Colors.RESET}"
+_DATA_FMT = f"%s{Colors.GRAY}%s:{Colors.RESET} {Colors.WHITE}%s{Colors.RESET}"
+_PREVIEW_TITLE = f"{Colors.BOLD}{Colors.MAGENTA}  Data Preview:{Colors.RESET}"
+_PREVIEW_LINE_FMT = f"{Colors.GRAY}    %s{Colors.RESET}"
+_PREVIEW_EMPTY = f"{Colors.GRAY}  (No data to display){Colors.RESET}"
+_RECORD_TITLE_FMT = f"{Colors.BOLD}{Colors.MAGENTA}  %s Record %d:{Colors.RESET}"
+_REMAINING_FMT = f"{Colors.GRAY}  ... and %d more %s records{Colors.RESET}"
+_INDENTS = tuple("  " * level for level in range(5))
+
+_PREVIEW_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _emit(*lines: str):
+    """Write several lines to stdout with a single write call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def print_header(title: str):
     """Print a formatted header"""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}  {title}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.RESET}\n")
+    _emit("", _RULE_LINE, _HEADER_FMT % (title,), _RULE_LINE, "")
 
 
 def print_section(title: str):
     """Print a section header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}>> {title}{Colors.RESET}")
-    print(f"{Colors.GRAY}{'-'*50}{Colors.RESET}")
+    _emit("", _SECTION_FMT % (title,), _SECTION_RULE)
 
 
 def print_success(message: str):
     """Print a success message"""
-    print(f"{Colors.GREEN}[SUCCESS] {message}{Colors.RESET}")
+    print(_SUCCESS_FMT % (message,))
 
 
 def print_error(message: str):
     """Print an error message"""
-    print(f"{Colors.RED}[ERROR] {message}{Colors.RESET}")
+    print(_ERROR_FMT % (message,))
 
 
 def print_warning(message: str):
     """Print a warning message"""
-    print(f"{Colors.YELLOW}[WARNING] {message}{Colors.RESET}")
+    print(_WARNING_FMT % (message,))
 
 
 def print_info(message: str):
     """Print an info message"""
-    print(f"{Colors.CYAN}[INFO] {message}{Colors.RESET}")
+    print(_INFO_FMT % (message,))
+
+
+def _format_data(label: str, value: Any, indent: int = 0) -> str:
+    """Format a labeled data line"""
+    spaces = _INDENTS[indent] if 0 <= indent < len(_INDENTS) else "  " * indent
+    return _DATA_FMT % (spaces, label, value)
 
 
 def print_data(label: str, value: str, indent: int = 0):
     """Print labeled data"""
-    spaces = "  " * indent
-    print(
-        f"{spaces}{Colors.GRAY}{label}:{Colors.RESET} {Colors.WHITE}{value}{Colors.RESET}"
-    )
+    print(_format_data(label, value, indent))
 
 
-def print_json_preview(data: Dict[str, Any], max_items: int = 3):
-    """Print a formatted JSON preview"""
-    if not data:
-        print(f"{Colors.GRAY}  (No data to display){Colors.RESET}")
-        return
+def print_data_lines(items: Iterable[Tuple[str, Any]], indent: int = 0):
+    """Print several (label, value) pairs with a single write"""
+    lines = [_format_data(label, value, indent) for label, value in items]
+    if lines:
+        _emit(*lines)
 
-    print(f"{Colors.BOLD}{Colors.MAGENTA}  Data Preview:{Colors.RESET}")
-    formatted = json.dumps(data, indent=2, ensure_ascii=False)
-    lines = formatted.split("\n")
 
-    # Show first few lines
-    for i, line in enumerate(lines[:15]):  # Show first 15 lines
-        if i < 14 or i == len(lines) - 1:
-            print(f"{Colors.GRAY}    {line}{Colors.RESET}")
-        elif i == 14 and len(lines) > 15:
-            print(f"{Colors.GRAY}    ... ({len(lines) - 15} more lines){Colors.RESET}")
-            break
+def _json_preview_lines(data: Dict[str, Any], max_lines: int = 15) -> List[str]:
+    """Format a JSON preview of at most max_lines lines as output lines"""
+    if not data:
+        return [_PREVIEW_EMPTY]
+
+    if json_utils.orjson is not None:
+        # orjson encodes the whole object in C faster than the stdlib can
+        # encode just the visible part
+        lines = json_utils.dumps_pretty(data).decode("utf-8").split("\n", max_lines)
+    else:
+        # Encode incrementally and stop as soon as there is one line more than
+        # can be shown, so large objects are never serialized in full
+        chunks = []
+        newlines = 0
+        for chunk in _PREVIEW_ENCODER.iterencode(data):
+            chunks.append(chunk)
+            newlines += chunk.count("\n")
+            if newlines >= max_lines:
+                break
+        lines = "".join(chunks).split("\n")
+
+    # Replace the last visible line with a marker if there is more
+    output = [_PREVIEW_TITLE]
+    if len(lines) > max_lines:
+        output.extend(_PREVIEW_LINE_FMT % (line,) for line in lines[:max_lines - 1])
+        output.append(_PREVIEW_LINE_FMT % ("... (more lines)",))
+    else:
+        output.extend(_PREVIEW_LINE_FMT % (line,) for line in lines)
+    return output
+
+
+def print_json_preview(data: Dict[str, Any], max_items: int = 3, max_lines: int = 15):
+    """Print a formatted JSON preview of at most max_lines lines"""
+    _emit(*_json_preview_lines(data, max_lines))
+
+
+def print_record_samples(
+    sections: Iterable[Tuple[str, str, List[Dict[str, Any]]]], max_records: int
+):
+    """
+    Print the first records of several datasets with a single write
+
+    Args:
+        sections: (title, record label, records) per dataset; empty ones are skipped
+        max_records: Number of records to preview per dataset
+    """
+    output = []
+    for title, label, records in sections:
+        if not records:
+            continue
+        output.append(_INFO_FMT % (f"{title}:",))
+        for i, record in enumerate(records[:max_records], 1):
+            output.extend(("", _RECORD_TITLE_FMT % (label, i)))
+            output.extend(_json_preview_lines(record))
+        if len(records) > max_records:
+            remaining = len(records) - max_records
+            noun = label if label.isupper() else label.lower()  # keep acronyms
+            output.extend(("", _REMAINING_FMT % (remaining, noun)))
+    if output:
+        _emit(*output)
 
 
 def confirm_proceed(
@@ -153,8 +246,6 @@ def get_dataset_name_input(default_name: str, custom_name: str = None) -> str:
     """
     # Check if we're in non-interactive mode and have a custom name
     try:
-        import sys
-
         if "main" in sys.modules:
             from main import NON_INTERACTIVE_MODE
 
@@ -165,9 +256,11 @@ def get_dataset_name_input(default_name: str, custom_name: str = None) -> str:
                 return custom_name
     except ImportError:
         pass
-    print(f"\n{Colors.BOLD}{Colors.BLUE}Dataset Name Configuration{Colors.RESET}")
-    print(f"{Colors.GRAY}{'-'*50}{Colors.RESET}")
-    print_data("Current dataset name", default_name, 1)
+    _emit(
+        f"\n{Colors.BOLD}{Colors.BLUE}Dataset Name Configuration{Colors.RESET}",
+        _SECTION_RULE,
+        _format_data("Current dataset name", default_name, 1),
+    )
 
     try:
         user_input = input(
@@ -207,8 +300,8 @@ def get_date_range_input(
     if non_interactive or os.environ.get("NON_INTERACTIVE") == "1":
         if start_date_str and end_date_str:
             try:
-                start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-                end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+                start_date = date.fromisoformat(start_date_str)
+                end_date = date.fromisoformat(end_date_str)
                 print_info(
                     f"[NON-INTERACTIVE] Using date range: {start_date} to {end_date}"
                 )
@@ -220,18 +313,21 @@ def get_date_range_input(
             except ValueError as e:
                 print_warning(f"Invalid date format in command line args: {e}")
                 # Fall back to interactive mode
-    print(f"\n{Colors.BOLD}{Colors.BLUE}Date Range Configuration{Colors.RESET}")
-    print(f"{Colors.GRAY}{'-'*50}{Colors.RESET}")
-
     # Set defaults to May-June 2025 range
     default_start_date = date(2025, 5, 1)  # May 1, 2025
     default_end_date = date(2025, 6, 1)  # June 1, 2025
 
-    print_data(
-        "Default start date", f"{default_start_date} (May 1, 2025, inclusive)", 1
+    _emit(
+        f"\n{Colors.BOLD}{Colors.BLUE}Date Range Configuration{Colors.RESET}",
+        _SECTION_RULE,
+        _format_data(
+            "Default start date", f"{default_start_date} (May 1, 2025, inclusive)", 1
+        ),
+        _format_data(
+            "Default end date", f"{default_end_date} (June 1, 2025, exclusive)", 1
+        ),
+        _format_data("Default range", "31 complete days (May 2025)", 1),
     )
-    print_data("Default end date", f"{default_end_date} (June 1, 2025, exclusive)", 1)
-    print_data("Default range", "31 complete days (May 2025)", 1)
 
     try:
         # Get start date
@@ -244,7 +340,7 @@ def get_date_range_input(
             print_success(f"Using default start date: {start_date}")
         else:
             try:
-                start_date = datetime.strptime(start_input, "%Y-%m-%d").date()
+                start_date = date.fromisoformat(start_input)
                 print_success(f"Using custom start date: {start_date}")
             except ValueError:
                 print_warning(f"Invalid date format '{start_input}', using default")
@@ -260,7 +356,7 @@ def get_date_range_input(
             print_success(f"Using default end date: {end_date}")
         else:
             try:
-                end_date = datetime.strptime(end_input, "%Y-%m-%d").date()
+                end_date = date.fromisoformat(end_input)
                 print_success(f"Using custom end date: {end_date}")
             except ValueError:
                 print_warning(f"Invalid date format '{end_input}', using default")
@@ -301,10 +397,12 @@ def get_limit_input(default_limit: int = 50, custom_limit: int = None) -> int:
     if custom_limit is not None:
         print_info(f"[NON-INTERACTIVE] Using custom limit: {custom_limit} records")
         return custom_limit
-    print(f"\n{Colors.BOLD}{Colors.BLUE}Record Limit Configuration{Colors.RESET}")
-    print(f"{Colors.GRAY}{'-'*50}{Colors.RESET}")
-    print_data("Default limit", f"{default_limit} records", 1)
-    print_info("Higher limits may take longer to process and upload")
+    _emit(
+        f"\n{Colors.BOLD}{Colors.BLUE}Record Limit Configuration{Colors.RESET}",
+        _SECTION_RULE,
+        _format_data("Default limit", f"{default_limit} records", 1),
+        _INFO_FMT % ("Higher limits may take longer to process and upload",),
+    )
 
     try:
         user_input = input(
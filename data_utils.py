@@ -3,12 +3,18 @@
 Data transformation utilities for dataset generation and format conversion
 """
 
-import json
+import gc
+import os
+import re
 import uuid
-from datetime import date, datetime
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+import json_utils
 from console_utils import (
     print_data,
     print_error,
@@ -24,6 +30,324 @@ from edg import EDGDatasetGenerator, EDGDataTransformer
 BIMENES_LATITUDE = 43.318200
 BIMENES_LONGITUDE = -5.557259
 
+# Datapoint templates, copied and filled in per record. Every key is present
+# up front so the copies never need to grow
+_GENERATION_DATAPOINT = {
+    "measurement": "generatedEnergy",
+    "unit": "kWh",
+    "value": 0.0,
+    "timestamp": "",
+    "timeseries_id": "",
+}
+_TEMPERATURE_DATAPOINT = {
+    "measurement": "outdoorTemperature",
+    "unit": "Celsius",
+    "value": 0.0,
+    "timestamp": "",
+    "timeseries_id": "",
+}
+_HUMIDITY_DATAPOINT = {
+    "measurement": "humidityLevel",
+    "unit": "Percent",
+    "value": 0.0,
+    "timestamp": "",
+    "timeseries_id": "",
+}
+_CONSUMPTION_DATAPOINT = {
+    "measurement": "consumedEnergy",
+    "unit": "kWh",
+    "value": 0.0,
+    "timestamp": "",
+    "timeseries_id": "",
+}
+
+# English month names for dataset titles (strftime("%B") depends on the C locale)
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Constant parts of the JSON-LD dataset definitions. They are shared between
+# calls and only ever serialized, so callers must not mutate them in place.
+_DATACELLAR_CONTEXT = {
+    "id": "@id",
+    "type": "@type",
+    "graph": "@graph",
+    "datacellar": "http://datacellar.org/schema#",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "sh": "http://www.w3.org/ns/shacl#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+    "datacellar:capacity": {"@type": "xsd:float"},
+    "datacellar:elevation": {"@type": "xsd:float"},
+    "datacellar:floorArea": {"@type": "xsd:float"},
+    "datacellar:insulationSurface": {"@type": "xsd:float"},
+    "datacellar:latitude": {"@type": "xsd:float"},
+    "datacellar:longitude": {"@type": "xsd:float"},
+    "datacellar:openingsArea": {"@type": "xsd:float"},
+    "datacellar:orientation": {"@type": "xsd:float"},
+    "datacellar:startDate": {"@type": "xsd:dateTime"},
+    "datacellar:endDate": {"@type": "xsd:dateTime"},
+    "datacellar:tilt": {"@type": "xsd:float"},
+    "datacellar:timestamp": {"@type": "xsd:dateTime"},
+    "datacellar:totalAnnualEnergyConsumption": {"@type": "xsd:float"},
+    "datacellar:value": {"@type": "xsd:float"},
+    "datacellar:granularity": {"@type": "xsd:float"},
+}
+
+# Hourly timeseries entry; _timeseries_entry copies it and fills in the rest.
+# The key order here is the key order of the serialized definitions
+_TIMESERIES_TEMPLATE = {
+    "@type": "datacellar:TimeSeries",
+    "@id": "",
+    "datacellar:timeSeriesId": "",
+    "datacellar:datasetFieldID": 0,
+    "datacellar:startDate": "",
+    "datacellar:endDate": "",
+    "datacellar:timeZone": "0",
+    "datacellar:granularity": 3600.0,
+    "datacellar:dataPoints": None,
+    "datacellar:latitude": 0.0,
+    "datacellar:longitude": 0.0,
+    "datacellar:timeSeriesMetadata": None,
+}
+
+_CONSUMPTION_SELF_DESCRIPTION = {
+    "@type": "datacellar:DatasetDescription",
+    "datacellar:datasetDescriptionID": 1,
+    "datacellar:datasetMetadataTypes": [
+        "datacellar:GeoLocalizedDataset",
+        "datacellar:Installation",
+    ],
+    "datacellar:datasetFields": [
+        {
+            "@type": "datacellar:DatasetField",
+            "datacellar:datasetFieldID": 1,
+            "datacellar:name": "consumedEnergy",
+            "datacellar:description": "The consumption of a household in kWh",
+            "datacellar:timeseriesMetadataType": "datacellar:EnergyMeter",
+            "datacellar:fieldType": {
+                "@type": "datacellar:FieldType",
+                "datacellar:unit": "kWh",
+                "datacellar:averagable": True,
+                "datacellar:summable": False,
+                "datacellar:anonymizable": False,
+            },
+        }
+    ],
+}
+
+_COMBINED_SELF_DESCRIPTION = {
+    "@type": "datacellar:DatasetDescription",
+    "datacellar:datasetDescriptionID": 1,
+    "datacellar:datasetMetadataTypes": [
+        "datacellar:GeoLocalizedDataset",
+        "datacellar:Installation",
+    ],
+    "datacellar:datasetFields": [
+        {
+            "@type": "datacellar:DatasetField",
+            "datacellar:datasetFieldID": 1,
+            "datacellar:name": "generatedEnergy",
+            "datacellar:description": "The generated energy of a PV in kWh",
+            "datacellar:timeseriesMetadataType": "datacellar:PVPanel",
+            "datacellar:fieldType": {
+                "@type": "datacellar:FieldType",
+                "datacellar:unit": "kWh",
+                "datacellar:averagable": False,
+                "datacellar:summable": True,
+                "datacellar:anonymizable": False,
+            },
+        },
+        {
+            "@type": "datacellar:DatasetField",
+            "datacellar:datasetFieldID": 2,
+            "datacellar:name": "outdoorTemperature",
+            "datacellar:description": "Ambient temperature in Celsius",
+            "datacellar:timeseriesMetadataType": "datacellar:PVPanel",
+            "datacellar:fieldType": {
+                "@type": "datacellar:FieldType",
+                "datacellar:unit": "Celsius",
+                "datacellar:averagable": True,
+                "datacellar:summable": False,
+                "datacellar:anonymizable": False,
+            },
+        },
+        {
+            "@type": "datacellar:DatasetField",
+            "datacellar:datasetFieldID": 3,
+            "datacellar:name": "humidityLevel",
+            "datacellar:description": "Humidity level in percentage",
+            "datacellar:timeseriesMetadataType": "datacellar:PVPanel",
+            "datacellar:fieldType": {
+                "@type": "datacellar:FieldType",
+                "datacellar:unit": "Percent",
+                "datacellar:averagable": True,
+                "datacellar:summable": False,
+                "datacellar:anonymizable": False,
+            },
+        },
+    ],
+}
+
+_CONSUMPTION_DATASET_METADATA = [
+    {
+        "@type": "datacellar:GeoLocalizedDataset",
+        "datacellar:latitude": BIMENES_LATITUDE,
+        "datacellar:longitude": BIMENES_LONGITUDE,
+    },
+    {
+        "@type": "datacellar:Installation",
+        "datacellar:installationType": "localEnergyCommunity",
+        "datacellar:capacity": 100.0,
+        "datacellar:capacityUnit": "kW",
+    },
+]
+
+
+# Full ISO datetime with an optional UTC offset (group 1)
+_ISO_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?([+-]\d{2}:?\d{2})?"
+)
+
+# Consumption batches repeat each hourly timestamp once per meter, so most
+# calls are cache hits; the bound keeps long-running imports from growing it
+@lru_cache(maxsize=65536)
+def _normalize_ts(timestamp: str) -> str:
+    """
+    Normalize an ISO timestamp to UTC ISO format with a Z suffix
+
+    Args:
+        timestamp: ISO datetime or date string
+
+    Returns:
+        Timestamp string ending in Z (or +00:00 if it already did)
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    # Callers skip empty values, so indexing the last character is safe and
+    # settles the common Z-suffixed case without a method call
+    if timestamp[-1] == "Z" or timestamp.endswith("+00:00"):
+        return timestamp
+
+    match = _ISO_DATETIME_RE.fullmatch(timestamp)
+    if match is None:
+        # Date-only or otherwise unusual input; fromisoformat decides, and
+        # any offset it parses is shifted to UTC like below
+        dt = datetime.fromisoformat(timestamp)
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return dt.isoformat() + "Z"
+    if match.group(1) is None:
+        # Naive datetimes are already UTC and only lack the suffix; parse anyway
+        # so out-of-range fields (e.g. month 13) still raise ValueError
+        datetime.fromisoformat(timestamp)
+        return timestamp + "Z"
+    # Shift offset datetimes to UTC so the Z suffix is truthful
+    utc = datetime.fromisoformat(timestamp).astimezone(timezone.utc)
+    return utc.replace(tzinfo=None).isoformat() + "Z"
+
+
+def _dataset_title(prefix: str, start_date: date, end_date: date) -> str:
+    """
+    Build a dataset title from the month(s) and year(s) covered
+
+    Args:
+        prefix: Title prefix (e.g. "FAEN Consumption")
+        start_date: First day of the range
+        end_date: Last day of the range
+
+    Returns:
+        Title such as "<prefix> May 2025" or "<prefix> May-June 2025"
+    """
+    start_month = _MONTH_NAMES[start_date.month - 1]
+    end_month = _MONTH_NAMES[end_date.month - 1]
+    same_year = start_date.year == end_date.year
+    same_month = same_year and start_date.month == end_date.month
+
+    # Indexed by same_year + same_month: different years, different months, same month
+    return (
+        f"{prefix} {start_month} {start_date.year} - {end_month} {end_date.year}",
+        f"{prefix} {start_month}-{end_month} {start_date.year}",
+        f"{prefix} {start_month} {start_date.year}",
+    )[same_year + same_month]
+
+
+def _timeseries_bounds(start_iso: str, end_iso: str) -> Tuple[str, str]:
+    """
+    Build the ISO start/end datetime strings covering full days
+
+    Args:
+        start_iso: First day of the range as an ISO date string
+        end_iso: Last day of the range (inclusive) as an ISO date string
+
+    Returns:
+        Tuple of (start of start day, 23:59:59 of end day) with Z suffix
+    """
+    return f"{start_iso}T00:00:00Z", f"{end_iso}T23:59:59Z"
+
+
+def _timeseries_entry(
+    field_id: int,
+    timeseries_start: str,
+    timeseries_end: str,
+    latitude: float,
+    longitude: float,
+    metadata: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Build an hourly datacellar:TimeSeries entry with a fresh GUID
+
+    Args:
+        field_id: datacellar:datasetFieldID the timeseries belongs to
+        timeseries_start: ISO start datetime string
+        timeseries_end: ISO end datetime string
+        latitude: Latitude of the timeseries
+        longitude: Longitude of the timeseries
+        metadata: datacellar:timeSeriesMetadata object
+
+    Returns:
+        Timeseries entry dictionary
+    """
+    timeseries_guid = str(uuid.uuid4())
+    entry = _TIMESERIES_TEMPLATE.copy()
+    entry["@id"] = f"http://datacellar.org/timeseries/{timeseries_guid}"
+    entry["datacellar:timeSeriesId"] = timeseries_guid
+    entry["datacellar:datasetFieldID"] = field_id
+    entry["datacellar:startDate"] = timeseries_start
+    entry["datacellar:endDate"] = timeseries_end
+    entry["datacellar:dataPoints"] = []
+    entry["datacellar:latitude"] = latitude
+    entry["datacellar:longitude"] = longitude
+    entry["datacellar:timeSeriesMetadata"] = metadata
+    return entry
+
+
+@lru_cache(maxsize=None)
+def _datasets_dir() -> Path:
+    """Return the datasets output directory, creating it on first use"""
+    datasets_dir = Path(__file__).parent / "datasets"
+    datasets_dir.mkdir(exist_ok=True)
+    return datasets_dir
+
+
+def _write_bytes(file_path: Path, data: bytes):
+    """
+    Write pre-serialized bytes to a file with as few write syscalls as possible
+
+    Args:
+        file_path: Destination file path (created or truncated)
+        data: File contents
+    """
+    fd = os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may write fewer bytes than requested
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 def save_dataset_definition(
     dataset_definition: Dict[str, Any],
@@ -38,6 +362,7 @@ def save_dataset_definition(
         dataset_definition: The dataset definition dictionary
         start_date: Start date (used for filename)
         end_date: End date (used for filename)
+        dataset_type: Dataset type (used for filename)
 
     Returns:
         Path to the saved file
@@ -51,18 +376,13 @@ def save_dataset_definition(
     # Create filename with date range and type
     filename = f"faen_{dataset_type}_dataset_definition_{start_date}_to_{end_date}.json"
 
-    # Save to the same directory as the script or create a datasets subdirectory
-    script_dir = Path(__file__).parent
-    datasets_dir = script_dir / "datasets"
-    datasets_dir.mkdir(exist_ok=True)
-
-    file_path = datasets_dir / filename
+    # Save to a datasets subdirectory next to the script
+    file_path = _datasets_dir() / filename
 
     try:
         print_info(f"Saving dataset definition to: {file_path}")
 
-        with open(file_path, "w", encoding="utf-8") as file:
-            json.dump(dataset_definition, file, indent=2, ensure_ascii=False)
+        _write_bytes(file_path, json_utils.dumps_pretty(dataset_definition))
 
         print_success("✓ Dataset definition saved successfully")
         print_data("File path", str(file_path), 1)
@@ -88,54 +408,25 @@ def transform_generation_to_datapoints(
     Returns:
         List of datapoint dictionaries ready for CDE API
     """
-    datapoints = []
-    skipped_records = 0
-    missing_timeseries = 0
-
     print_info(
         f"Transforming {len(generation_data)} FAEN generation records to CDE datapoints"
     )
 
-    for record in generation_data:
-        user_id = record.get("user_id")
-        # Extract generation from nested data object
-        data_obj = record.get("data", {})
-        generation_value = data_obj.get("generation_kwh")
-        datetime_str = record.get("datetime")
-
-        # Skip records with missing essential data
-        if not user_id or generation_value is None or not datetime_str:
-            skipped_records += 1
-            continue
-
-        # Get the generation timeseries ID (all generation data goes to the same timeseries)
-        timeseries_id = timeseries_mapping.get("generation")
-        if not timeseries_id:
-            missing_timeseries += 1
-            continue
-
-        # Ensure timestamp is in ISO format with Z suffix
-        timestamp = datetime_str
-        if not timestamp.endswith("Z") and not timestamp.endswith("+00:00"):
-            try:
-                if "T" in timestamp:
-                    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                else:
-                    dt = datetime.fromisoformat(timestamp)
-                timestamp = dt.isoformat() + "Z"
-            except ValueError:
-                print_warning(f"⚠ Invalid datetime format: {timestamp}")
-                continue
-
-        datapoint = {
-            "measurement": "generatedEnergy",
-            "unit": "kWh",
-            "value": float(generation_value),
-            "timestamp": timestamp,
-            "timeseries_id": timeseries_id,
-        }
+    # All generation data goes to the same timeseries; without one there is
+    # nothing to transform
+    timeseries_id = timeseries_mapping.get("generation")
+    if not timeseries_id:
+        print_warning(
+            f"⚠ Skipped {len(generation_data)} records with no matching timeseries"
+        )
+        return []
 
-        datapoints.append(datapoint)
+    datapoints, skipped_records, missing_timeseries, invalid_timestamps = _build_datapoints(
+        generation_data,
+        _generation_value,
+        {**_GENERATION_DATAPOINT, "timeseries_id": timeseries_id},
+        None,
+    )
 
     # Print summary
     print_success(f"✓ Transformed {len(datapoints)} generation records to datapoints")
@@ -145,6 +436,10 @@ def transform_generation_to_datapoints(
         print_warning(
             f"⚠ Skipped {missing_timeseries} records with no matching timeseries"
         )
+    if invalid_timestamps > 0:
+        print_warning(
+            f"⚠ Skipped {invalid_timestamps} records with invalid datetime format"
+        )
 
     return datapoints
 
@@ -165,63 +460,40 @@ def transform_weather_to_datapoints(
     Returns:
         List of datapoint dictionaries ready for CDE API
     """
-    datapoints = []
-    skipped_records = 0
-
     print_info(
         f"Transforming {len(weather_data)} FAEN weather records to CDE datapoints"
     )
 
-    for record in weather_data:
-        # Extract temperature and humidity values
-        temperature_value = record.get("ta")  # Air temperature
-        humidity_value = record.get("hr")  # Relative humidity
-        datetime_str = record.get("datetime_utc")
-
-        # Skip records with missing datetime
-        if not datetime_str:
-            skipped_records += 1
+    # Air temperature ("ta") and relative humidity ("hr") each become their own
+    # datapoints; a measurement without a timeseries is left out
+    datapoints = []
+    skipped_values = 0
+    invalid_timestamps = 0
+    for key, template, timeseries_id in (
+        ("ta", _TEMPERATURE_DATAPOINT, temperature_timeseries_id),
+        ("hr", _HUMIDITY_DATAPOINT, humidity_timeseries_id),
+    ):
+        if not timeseries_id:
             continue
-
-        # Ensure timestamp is in ISO format with Z suffix
-        timestamp = datetime_str
-        if not timestamp.endswith("Z") and not timestamp.endswith("+00:00"):
-            try:
-                if "T" in timestamp:
-                    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                else:
-                    dt = datetime.fromisoformat(timestamp)
-                timestamp = dt.isoformat() + "Z"
-            except ValueError:
-                print_warning(f"⚠ Invalid datetime format: {timestamp}")
-                continue
-
-        # Add temperature datapoint if available
-        if temperature_value is not None:
-            temperature_datapoint = {
-                "measurement": "outdoorTemperature",
-                "unit": "Celsius",
-                "value": float(temperature_value),
-                "timestamp": timestamp,
-                "timeseries_id": temperature_timeseries_id,
-            }
-            datapoints.append(temperature_datapoint)
-
-        # Add humidity datapoint if available
-        if humidity_value is not None:
-            humidity_datapoint = {
-                "measurement": "humidityLevel",
-                "unit": "Percent",
-                "value": float(humidity_value),
-                "timestamp": timestamp,
-                "timeseries_id": humidity_timeseries_id,
-            }
-            datapoints.append(humidity_datapoint)
+        measurement_datapoints, skipped, _, invalid = _build_datapoints(
+            weather_data,
+            itemgetter(key),
+            {**template, "timeseries_id": timeseries_id},
+            None,
+            "datetime_utc",
+        )
+        datapoints.extend(measurement_datapoints)
+        skipped_values += skipped
+        invalid_timestamps += invalid
 
     # Print summary
     print_success(f"✓ Transformed {len(datapoints)} weather datapoints")
-    if skipped_records > 0:
-        print_warning(f"⚠ Skipped {skipped_records} records with missing datetime")
+    if skipped_values > 0:
+        print_warning(f"⚠ Skipped {skipped_values} weather values with missing data")
+    if invalid_timestamps > 0:
+        print_warning(
+            f"⚠ Skipped {invalid_timestamps} weather values with invalid datetime format"
+        )
 
     return datapoints
 
@@ -239,54 +511,27 @@ def transform_faen_to_datapoints(
     Returns:
         List of datapoint dictionaries ready for CDE API
     """
-    datapoints = []
-    skipped_records = 0
-    missing_timeseries = 0
-
     print_info(f"Transforming {len(faen_data)} FAEN records to CDE datapoints")
 
-    for i, record in enumerate(faen_data):
-        user_id = record.get("user_id")
-        # Extract consumption from nested data object
-        data_obj = record.get("data", {})
-        consumption_value = data_obj.get("energy_consumption_kwh")
-        datetime_str = record.get("datetime")
-
-        # Skip records with missing essential data
-        if not user_id or consumption_value is None or not datetime_str:
-            skipped_records += 1
-            continue
-
-        # Get the corresponding timeseries ID
-        timeseries_id = timeseries_mapping.get(str(user_id))
-        if not timeseries_id:
-            missing_timeseries += 1
-            continue
-
-        # Ensure timestamp is in ISO format with Z suffix
-        timestamp = datetime_str
-        if not timestamp.endswith("Z") and not timestamp.endswith("+00:00"):
-            # Parse datetime and convert to UTC ISO format
-            try:
-                if "T" in timestamp:
-                    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                else:
-                    # Handle date-only format
-                    dt = datetime.fromisoformat(timestamp)
-                timestamp = dt.isoformat() + "Z"
-            except ValueError:
-                print_warning(f"⚠ Invalid datetime format: {timestamp}")
-                continue
-
-        datapoint = {
-            "measurement": "consumedEnergy",
-            "unit": "kWh",
-            "value": float(consumption_value),
-            "timestamp": timestamp,
-            "timeseries_id": timeseries_id,
-        }
-
-        datapoints.append(datapoint)
+    # Key the mapping by str once so string user_ids need no conversion per record
+    timeseries_by_user = {str(key): value for key, value in timeseries_mapping.items()}
+
+    def timeseries_for_record(record: Dict[str, Any]) -> Any:
+        user_id = record["user_id"]
+        try:
+            return timeseries_by_user[user_id]
+        except KeyError:
+            # Non-str user_ids are converted once and then cached under their
+            # own key; unknown users are cached as None
+            timeseries_id = timeseries_by_user[user_id] = timeseries_by_user.get(str(user_id))
+            return timeseries_id
+
+    datapoints, skipped_records, missing_timeseries, invalid_timestamps = _build_datapoints(
+        faen_data,
+        _consumption_value,
+        _CONSUMPTION_DATAPOINT,
+        timeseries_for_record,
+    )
 
     # Print summary
     print_success(f"✓ Transformed {len(datapoints)} FAEN records to datapoints")
@@ -298,10 +543,116 @@ def transform_faen_to_datapoints(
         print_warning(
             f"⚠ Skipped {missing_timeseries} records with no matching timeseries"
         )
+    if invalid_timestamps > 0:
+        print_warning(
+            f"⚠ Skipped {invalid_timestamps} records with invalid datetime format"
+        )
 
     return datapoints
 
 
+def _generation_value(record: Dict[str, Any]) -> Any:
+    """Generation reading of a FAEN record, or None if it has no user_id"""
+    return record["data"]["generation_kwh"] if record["user_id"] else None
+
+
+def _consumption_value(record: Dict[str, Any]) -> Any:
+    """Consumption reading of a FAEN record, or None if it has no user_id"""
+    return record["data"]["energy_consumption_kwh"] if record["user_id"] else None
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause cyclic garbage collection while allocating many acyclic objects"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _build_datapoints(
+    records: List[Dict[str, Any]],
+    extract_value: Callable[[Dict[str, Any]], Any],
+    template: Dict[str, Any],
+    timeseries_for_record: Optional[Callable[[Dict[str, Any]], Any]],
+    datetime_key: str = "datetime",
+) -> Tuple[List[Dict[str, Any]], int, int, int]:
+    """
+    Turn FAEN records into CDE datapoints for one measurement
+
+    Args:
+        records: List of FAEN records
+        extract_value: Returns the reading of a record (None if missing)
+        template: Datapoint template holding the measurement and unit
+        timeseries_for_record: Returns the timeseries ID of a record (falsy if
+            unknown); None when every record shares the template's timeseries_id
+        datetime_key: Record key holding the timestamp
+
+    Returns:
+        Tuple of (datapoints, skipped_records, missing_timeseries, invalid_timestamps)
+    """
+    # Each record yields at most one datapoint, so size the list up front and
+    # trim the unused tail once at the end
+    datapoints: List[Any] = [None] * len(records)
+    count = 0
+    skipped_records = 0
+    missing_timeseries = 0
+    invalid_timestamps = 0
+
+    # Bind hot-loop lookups to locals
+    normalize_ts = _normalize_ts
+    to_float = float
+    new_datapoint = template.copy
+
+    # Datapoints are flat dicts that can never form reference cycles, so
+    # collector passes triggered by allocating them would be wasted work
+    with _gc_paused():
+        for record in records:
+            # Subscripts are cheaper than .get() chains for the well-formed common
+            # case; a missing key (or a null data object) counts as missing data
+            try:
+                value = extract_value(record)
+                datetime_str = record[datetime_key]
+            except (KeyError, TypeError):
+                skipped_records += 1
+                continue
+
+            # Skip records with missing essential data
+            if value is None or not datetime_str:
+                skipped_records += 1
+                continue
+
+            if timeseries_for_record is not None:
+                timeseries_id = timeseries_for_record(record)
+                if not timeseries_id:
+                    missing_timeseries += 1
+                    continue
+
+            # Ensure timestamp is in ISO format with Z suffix. The cached helper
+            # returns one shared string per distinct raw timestamp, so datapoints
+            # for meters that report the same hour don't each keep their own copy
+            try:
+                timestamp = normalize_ts(datetime_str)
+            except ValueError:
+                invalid_timestamps += 1
+                continue
+
+            datapoint = new_datapoint()
+            # JSON numbers usually arrive as floats already; only convert the rest
+            datapoint["value"] = value if type(value) is float else to_float(value)
+            datapoint["timestamp"] = timestamp
+            if timeseries_for_record is not None:
+                datapoint["timeseries_id"] = timeseries_id
+            datapoints[count] = datapoint
+            count += 1
+
+    del datapoints[count:]
+    return datapoints, skipped_records, missing_timeseries, invalid_timestamps
+
+
 def generate_combined_dataset_definition(
     start_date: Union[date, datetime],
     end_date: Union[date, datetime],
@@ -327,43 +678,20 @@ def generate_combined_dataset_definition(
         end_date = end_date.date()
 
     # Generate title based on date range
-    start_month_name = start_date.strftime("%B")
-    end_month_name = end_date.strftime("%B")
-    start_year = start_date.year
-    end_year = end_date.year
-
-    if start_date.year == end_date.year:
-        if start_date.month == end_date.month:
-            # Same month and year
-            title = f"FAEN Generation & Weather {start_month_name} {start_year}"
-        else:
-            # Different months, same year
-            title = f"FAEN Generation & Weather {start_month_name}-{end_month_name} {start_year}"
-    else:
-        # Different years
-        title = f"FAEN Generation & Weather {start_month_name} {start_year} - {end_month_name} {end_year}"
+    title = _dataset_title("FAEN Generation & Weather", start_date, end_date)
 
-    # Create ISO datetime strings for the time series
-    timeseries_start = (
-        datetime.combine(start_date, datetime.min.time()).isoformat() + "Z"
-    )
-    timeseries_end = (
-        datetime.combine(end_date, datetime.max.time())
-        .replace(microsecond=0)
-        .isoformat()
-        + "Z"
-    )
+    # Create ISO date and datetime strings once for the description and all timeseries
+    start_iso, end_iso = start_date.isoformat(), end_date.isoformat()
+    timeseries_start, timeseries_end = _timeseries_bounds(start_iso, end_iso)
 
     # Extract unique user_ids from generation data for generation timeseries
-    generation_user_ids = []
-    if generation_data:
-        user_ids_set = set()
-        for record in generation_data:
-            user_id = record.get("user_id")
-            if user_id and user_id not in user_ids_set:
-                user_ids_set.add(user_id)
-                generation_user_ids.append(user_id)
-        generation_user_ids.sort()
+    generation_user_ids = sorted(
+        user_id
+        for user_id in dict.fromkeys(
+            record.get("user_id") for record in generation_data or ()
+        )
+        if user_id
+    )
 
     # If no generation data, create a generic user
     if not generation_user_ids:
@@ -410,154 +738,38 @@ def generate_combined_dataset_definition(
         f"Creating combined dataset with {len(generation_user_ids)} generation users"
     )
 
-    # Create timeseries entries - 3 timeseries total
-    timeseries_entries = []
-    timeseries_guid = ""
-
-    # 1. Generation timeseries (one per user)
-    for user_id in generation_user_ids:
-        timeseries_guid = f"{uuid.uuid4()}"
-
-        generation_timeseries = {
-            "@type": "datacellar:TimeSeries",
-            "@id": f"http://datacellar.org/timeseries/{timeseries_guid}",
-            "datacellar:timeSeriesId": timeseries_guid,
-            "datacellar:datasetFieldID": 1,  # Generation field ID
-            "datacellar:startDate": timeseries_start,
-            "datacellar:endDate": timeseries_end,
-            "datacellar:timeZone": "0",
-            "datacellar:granularity": 3600.0,
-            "datacellar:dataPoints": [],
-            "datacellar:latitude": latitude,
-            "datacellar:longitude": longitude,
-            "datacellar:timeSeriesMetadata": {
-                "@type": "datacellar:PVPanel"
-            }
-        }
-        timeseries_entries.append(generation_timeseries)
-
-    # 2. Temperature timeseries (single weather station)
-    timeseries_guid = f"{uuid.uuid4()}"
-
-    temperature_timeseries = {
-        "@type": "datacellar:TimeSeries",
-        "@id": f"http://datacellar.org/timeseries/{timeseries_guid}",
-        "datacellar:timeSeriesId": timeseries_guid,
-        "datacellar:datasetFieldID": 2,  # Temperature field ID
-        "datacellar:startDate": timeseries_start,
-        "datacellar:endDate": timeseries_end,
-        "datacellar:timeZone": "0",
-        "datacellar:granularity": 3600.0,
-        "datacellar:dataPoints": [],
-        "datacellar:longitude": longitude,
-        "datacellar:latitude": latitude,
-        "datacellar:timeSeriesMetadata": {
-            "@type": "datacellar:PVPanel"
-        }
-    }
-    timeseries_entries.append(temperature_timeseries)
-
-    # 3. Humidity timeseries (single weather station)
-    timeseries_guid = f"{uuid.uuid4()}"
-    humidity_timeseries = {
-        "@type": "datacellar:TimeSeries",
-        "@id": f"http://datacellar.org/timeseries/{timeseries_guid}",
-        "datacellar:timeSeriesId": timeseries_guid,
-        "datacellar:datasetFieldID": 3,  # Humidity field ID
-        "datacellar:startDate": timeseries_start,
-        "datacellar:endDate": timeseries_end,
-        "datacellar:timeZone": "0",
-        "datacellar:granularity": 3600.0,
-        "datacellar:dataPoints": [],
-        "datacellar:longitude": longitude,
-        "datacellar:latitude": latitude,
-        "datacellar:timeSeriesMetadata": {
-            "@type": "datacellar:PVPanel"
-        }
-    }
-    timeseries_entries.append(humidity_timeseries)
+    # Create timeseries entries: one generation timeseries per user, plus
+    # temperature and humidity from the single weather station
+    timeseries_entries = [
+        _timeseries_entry(
+            1,  # Generation field ID
+            timeseries_start,
+            timeseries_end,
+            latitude,
+            longitude,
+            {"@type": "datacellar:PVPanel"},
+        )
+        for user_id in generation_user_ids
+    ]
+    for field_id in (2, 3):  # Temperature and humidity field IDs
+        timeseries_entries.append(
+            _timeseries_entry(
+                field_id,
+                timeseries_start,
+                timeseries_end,
+                latitude,
+                longitude,
+                {"@type": "datacellar:PVPanel"},
+            )
+        )
 
     # Dataset definition with 3 field types
     dataset_definition = {
-        "@context": {
-            "id": "@id",
-            "type": "@type",
-            "graph": "@graph",
-            "datacellar": "http://datacellar.org/schema#",
-            "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-            "sh": "http://www.w3.org/ns/shacl#",
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "datacellar:capacity": {"@type": "xsd:float"},
-            "datacellar:elevation": {"@type": "xsd:float"},
-            "datacellar:floorArea": {"@type": "xsd:float"},
-            "datacellar:insulationSurface": {"@type": "xsd:float"},
-            "datacellar:latitude": {"@type": "xsd:float"},
-            "datacellar:longitude": {"@type": "xsd:float"},
-            "datacellar:openingsArea": {"@type": "xsd:float"},
-            "datacellar:orientation": {"@type": "xsd:float"},
-            "datacellar:startDate": {"@type": "xsd:dateTime"},
-            "datacellar:endDate": {"@type": "xsd:dateTime"},
-            "datacellar:tilt": {"@type": "xsd:float"},
-            "datacellar:timestamp": {"@type": "xsd:dateTime"},
-            "datacellar:totalAnnualEnergyConsumption": {"@type": "xsd:float"},
-            "datacellar:value": {"@type": "xsd:float"},
-            "datacellar:granularity": {"@type": "xsd:float"},
-        },
+        "@context": _DATACELLAR_CONTEXT,
         "@type": "datacellar:Dataset",
         "datacellar:name": title,
-        "datacellar:description": f"Combined dataset with generation, temperature, and humidity data from {start_date.isoformat()} to {end_date.isoformat()}",
-        "datacellar:datasetSelfDescription": {
-            "@type": "datacellar:DatasetDescription",
-            "datacellar:datasetDescriptionID": 1,
-            "datacellar:datasetMetadataTypes": [
-                "datacellar:GeoLocalizedDataset",
-                "datacellar:Installation",
-            ],
-            "datacellar:datasetFields": [
-                {
-                    "@type": "datacellar:DatasetField",
-                    "datacellar:datasetFieldID": 1,
-                    "datacellar:name": "generatedEnergy",
-                    "datacellar:description": "The generated energy of a PV in kWh",
-                    "datacellar:timeseriesMetadataType": "datacellar:PVPanel",
-                    "datacellar:fieldType": {
-                        "@type": "datacellar:FieldType",
-                        "datacellar:unit": "kWh",
-                        "datacellar:averagable": False,
-                        "datacellar:summable": True,
-                        "datacellar:anonymizable": False,
-                    },
-                },
-                {
-                    "@type": "datacellar:DatasetField",
-                    "datacellar:datasetFieldID": 2,
-                    "datacellar:name": "outdoorTemperature",
-                    "datacellar:description": "Ambient temperature in Celsius",
-                    "datacellar:timeseriesMetadataType": "datacellar:PVPanel",
-                    "datacellar:fieldType": {
-                        "@type": "datacellar:FieldType",
-                        "datacellar:unit": "Celsius",
-                        "datacellar:averagable": True,
-                        "datacellar:summable": False,
-                        "datacellar:anonymizable": False,
-                    },
-                },
-                {
-                    "@type": "datacellar:DatasetField",
-                    "datacellar:datasetFieldID": 3,
-                    "datacellar:name": "humidityLevel",
-                    "datacellar:description": "Humidity level in percentage",
-                    "datacellar:timeseriesMetadataType": "datacellar:PVPanel",
-                    "datacellar:fieldType": {
-                        "@type": "datacellar:FieldType",
-                        "datacellar:unit": "Percent",
-                        "datacellar:averagable": True,
-                        "datacellar:summable": False,
-                        "datacellar:anonymizable": False,
-                    },
-                },
-            ],
-        },
+        "datacellar:description": f"Combined dataset with generation, temperature, and humidity data from {start_iso} to {end_iso}",
+        "datacellar:datasetSelfDescription": _COMBINED_SELF_DESCRIPTION,
         "datacellar:timeSeries": timeseries_entries,
         "datacellar:datasetMetadata": [
             {
@@ -582,6 +794,7 @@ def create_combined_dataset_and_datapoints(
     end_date: Union[date, datetime],
     generation_data: List[Dict[str, Any]],
     weather_data: List[Dict[str, Any]],
+    keep_datapoints: bool = True,
 ) -> tuple[Dict[str, Any], List[Dict[str, Any]]]:
     """
     Create complete combined dataset definition and transform all data to datapoints
@@ -591,9 +804,12 @@ def create_combined_dataset_and_datapoints(
         end_date: End date
         generation_data: List of FAEN generation records
         weather_data: List of FAEN weather records
+        keep_datapoints: Also return the CDE datapoints; when False only the
+            dataset-format copies embedded in the timeseries are kept in memory
 
     Returns:
-        Tuple of (dataset_definition, all_datapoints)
+        Tuple of (dataset_definition, all_datapoints); all_datapoints is empty
+        when keep_datapoints is False
     """
     print_section("🔧 Creating Combined Dataset")
 
@@ -630,24 +846,33 @@ def create_combined_dataset_and_datapoints(
     print_info(f"Temperature timeseries ID: {temperature_timeseries_id}")
     print_info(f"Humidity timeseries ID: {humidity_timeseries_id}")
 
-    # Transform all data to datapoints
+    # Transform all data to datapoints, reshaping each batch into dataset
+    # format (grouped by timeseries) as soon as it is produced
     all_datapoints = []
+    total_datapoints = 0
+    points_by_timeseries: Dict[str, List[Dict[str, Any]]] = {}
 
     # Transform generation data
-    generation_datapoints = []
     if generation_data and generation_timeseries_mapping:
         generation_datapoints = transform_generation_to_datapoints(
             generation_data, generation_timeseries_mapping
         )
-        all_datapoints.extend(generation_datapoints)
+        _add_dataset_points(generation_datapoints, points_by_timeseries)
+        total_datapoints += len(generation_datapoints)
+        if keep_datapoints:
+            all_datapoints.extend(generation_datapoints)
+        del generation_datapoints
 
     # Transform weather data
-    weather_datapoints = []
     if weather_data and temperature_timeseries_id and humidity_timeseries_id:
         weather_datapoints = transform_weather_to_datapoints(
             weather_data, temperature_timeseries_id, humidity_timeseries_id
         )
-        all_datapoints.extend(weather_datapoints)
+        _add_dataset_points(weather_datapoints, points_by_timeseries)
+        total_datapoints += len(weather_datapoints)
+        if keep_datapoints:
+            all_datapoints.extend(weather_datapoints)
+        del weather_datapoints
 
     # Now populate the dataPoints arrays in the timeseries
     for ts in timeseries:
@@ -655,65 +880,49 @@ def create_combined_dataset_and_datapoints(
 
         if field_id == 1:  # Generation
             device_id = ts["datacellar:timeSeriesMetadata"].get("datacellar:deviceID")
-            if device_id:
-                # Find all datapoints for this generation timeseries
-                ts_id = generation_timeseries_mapping.get(device_id)
-                if ts_id:
-                    ts_datapoints = [
-                        dp
-                        for dp in generation_datapoints
-                        if dp.get("timeseries_id") == ts_id
-                    ]
-                    # Convert to dataset format (remove timeseries_id, add proper structure)
-                    ts["datacellar:dataPoints"] = [
-                        {
-                            "datacellar:timestamp": dp["timestamp"],
-                            "datacellar:value": dp["value"],
-                        }
-                        for dp in ts_datapoints
-                    ]
-
+            ts_id = generation_timeseries_mapping.get(device_id) if device_id else None
         elif field_id == 2:  # Temperature
-            if temperature_timeseries_id:
-                temp_datapoints = [
-                    dp
-                    for dp in weather_datapoints
-                    if dp.get("measurement") == "temperature"
-                ]
-                ts["datacellar:dataPoints"] = [
-                    {
-                        "datacellar:timestamp": dp["timestamp"],
-                        "datacellar:value": dp["value"],
-                    }
-                    for dp in temp_datapoints
-                ]
-
+            ts_id = temperature_timeseries_id
         elif field_id == 3:  # Humidity
-            if humidity_timeseries_id:
-                humidity_datapoints = [
-                    dp
-                    for dp in weather_datapoints
-                    if dp.get("measurement") == "humidityLevel"
-                ]
-                ts["datacellar:dataPoints"] = [
-                    {
-                        "datacellar:timestamp": dp["timestamp"],
-                        "datacellar:value": dp["value"],
-                    }
-                    for dp in humidity_datapoints
-                ]
+            ts_id = humidity_timeseries_id
+        else:
+            ts_id = None
+
+        if ts_id:
+            ts["datacellar:dataPoints"] = points_by_timeseries.get(ts_id, [])
 
     # Count total datapoints in timeseries
     total_ts_datapoints = sum(
         len(ts.get("datacellar:dataPoints", [])) for ts in timeseries
     )
 
-    print_success(f"✓ Created dataset with {len(all_datapoints)} total datapoints")
+    print_success(f"✓ Created dataset with {total_datapoints} total datapoints")
     print_success(f"✓ Populated {total_ts_datapoints} datapoints in timeseries")
 
     return dataset_definition, all_datapoints
 
 
+def _add_dataset_points(
+    datapoints: List[Dict[str, Any]],
+    points_by_timeseries: Dict[str, List[Dict[str, Any]]],
+):
+    """
+    Group CDE datapoints by timeseries in dataset (datacellar:dataPoints) format
+
+    Args:
+        datapoints: CDE datapoints with timeseries_id, timestamp and value
+        points_by_timeseries: Lists of dataset points keyed by timeseries_id, extended in place
+    """
+    for dp in datapoints:
+        # Dataset points drop the measurement, unit and timeseries_id
+        points_by_timeseries.setdefault(dp["timeseries_id"], []).append(
+            {
+                "datacellar:timestamp": dp["timestamp"],
+                "datacellar:value": dp["value"],
+            }
+        )
+
+
 def generate_dataset_definition(
     start_date: Union[date, datetime],
     end_date: Union[date, datetime],
@@ -737,45 +946,20 @@ def generate_dataset_definition(
         end_date = end_date.date()
 
     # Generate title based on date range (assuming full months)
-    start_month_name = start_date.strftime("%B")
-    end_month_name = end_date.strftime("%B")
-    start_year = start_date.year
-    end_year = end_date.year
-
-    if start_date.year == end_date.year:
-        if start_date.month == end_date.month:
-            # Same month and year
-            title = f"FAEN Consumption {start_month_name} {start_year}"
-        else:
-            # Different months, same year
-            title = f"FAEN Consumption {start_month_name}-{end_month_name} {start_year}"
-    else:
-        # Different years
-        title = f"FAEN Consumption {start_month_name} {start_year} - {end_month_name} {end_year}"
-
-    # Create ISO datetime strings for the time series (start of start_date to end of end_date)
-    timeseries_start = (
-        datetime.combine(start_date, datetime.min.time()).isoformat() + "Z"
-    )
-    # Adjust end to be 23:59:59 of the end_date
-    timeseries_end = (
-        datetime.combine(end_date, datetime.max.time())
-        .replace(microsecond=0)
-        .isoformat()
-        + "Z"
+    title = _dataset_title("FAEN Consumption", start_date, end_date)
+
+    # Create ISO date and datetime strings once for the description and all
+    # timeseries (start of start_date to 23:59:59 of end_date)
+    start_iso, end_iso = start_date.isoformat(), end_date.isoformat()
+    timeseries_start, timeseries_end = _timeseries_bounds(start_iso, end_iso)
+
+    # Extract unique user_ids from FAEN data, sorted for consistent ordering
+    unique_user_ids = sorted(
+        user_id
+        for user_id in dict.fromkeys(record.get("user_id") for record in faen_data or ())
+        if user_id
     )
 
-    # Extract unique user_ids from FAEN data
-    unique_user_ids = []
-    if faen_data:
-        user_ids_set = set()
-        for record in faen_data:
-            user_id = record.get("user_id")
-            if user_id and user_id not in user_ids_set:
-                user_ids_set.add(user_id)
-                unique_user_ids.append(user_id)
-        unique_user_ids.sort()  # Sort for consistent ordering
-
     # If no FAEN data provided, create a single generic timeseries
     if not unique_user_ids:
         unique_user_ids = ["generic_user"]
@@ -785,97 +969,31 @@ def generate_dataset_definition(
     )
 
     # Create timeseries entries for each user
-    timeseries_entries = []
-    for idx, user_id in enumerate(unique_user_ids, 1):
-        timeseries_guid = f"{uuid.uuid4()}"
-
-        timeseries_entry = {
-            "@type": "datacellar:TimeSeries",
-            "@id": f"http://datacellar.org/timeseries/{timeseries_guid}",
-            "datacellar:timeSeriesId": timeseries_guid,
-            "datacellar:datasetFieldID": 1,
-            "datacellar:startDate": timeseries_start,
-            "datacellar:endDate": timeseries_end,
-            "datacellar:timeZone": "0",
-            "datacellar:granularity": 3600.0,
-            "datacellar:dataPoints": [],
-            "datacellar:latitude": BIMENES_LATITUDE,
-            "datacellar:longitude": BIMENES_LONGITUDE,
-            "datacellar:timeSeriesMetadata": {
+    timeseries_entries = [
+        _timeseries_entry(
+            1,
+            timeseries_start,
+            timeseries_end,
+            BIMENES_LATITUDE,
+            BIMENES_LONGITUDE,
+            {
                 "@type": "datacellar:EnergyMeter",
                 "datacellar:deviceID": user_id,
                 "datacellar:loadType": "aggregate",
             },
-        }
-        timeseries_entries.append(timeseries_entry)
+        )
+        for user_id in unique_user_ids
+    ]
 
     # Dataset definition template based on faen_consumption_july_2022_definition.json
     dataset_definition = {
-        "@context": {
-            "id": "@id",
-            "type": "@type",
-            "graph": "@graph",
-            "datacellar": "http://datacellar.org/schema#",
-            "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-            "sh": "http://www.w3.org/ns/shacl#",
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "datacellar:capacity": {"@type": "xsd:float"},
-            "datacellar:elevation": {"@type": "xsd:float"},
-            "datacellar:floorArea": {"@type": "xsd:float"},
-            "datacellar:insulationSurface": {"@type": "xsd:float"},
-            "datacellar:latitude": {"@type": "xsd:float"},
-            "datacellar:longitude": {"@type": "xsd:float"},
-            "datacellar:openingsArea": {"@type": "xsd:float"},
-            "datacellar:orientation": {"@type": "xsd:float"},
-            "datacellar:startDate": {"@type": "xsd:dateTime"},
-            "datacellar:endDate": {"@type": "xsd:dateTime"},
-            "datacellar:tilt": {"@type": "xsd:float"},
-            "datacellar:timestamp": {"@type": "xsd:dateTime"},
-            "datacellar:totalAnnualEnergyConsumption": {"@type": "xsd:float"},
-            "datacellar:value": {"@type": "xsd:float"},
-            "datacellar:granularity": {"@type": "xsd:float"},
-        },
+        "@context": _DATACELLAR_CONTEXT,
         "@type": "datacellar:Dataset",
         "datacellar:name": title,
-        "datacellar:description": f"Dataset covering the consumption of FAEN users from {start_date.isoformat()} to {end_date.isoformat()}",
-        "datacellar:datasetSelfDescription": {
-            "@type": "datacellar:DatasetDescription",
-            "datacellar:datasetDescriptionID": 1,
-            "datacellar:datasetMetadataTypes": [
-                "datacellar:GeoLocalizedDataset",
-                "datacellar:Installation",
-            ],
-            "datacellar:datasetFields": [
-                {
-                    "@type": "datacellar:DatasetField",
-                    "datacellar:datasetFieldID": 1,
-                    "datacellar:name": "consumedEnergy",
-                    "datacellar:description": "The consumption of a household in kWh",
-                    "datacellar:timeseriesMetadataType": "datacellar:EnergyMeter",
-                    "datacellar:fieldType": {
-                        "@type": "datacellar:FieldType",
-                        "datacellar:unit": "kWh",
-                        "datacellar:averagable": True,
-                        "datacellar:summable": False,
-                        "datacellar:anonymizable": False,
-                    },
-                }
-            ],
-        },
+        "datacellar:description": f"Dataset covering the consumption of FAEN users from {start_iso} to {end_iso}",
+        "datacellar:datasetSelfDescription": _CONSUMPTION_SELF_DESCRIPTION,
         "datacellar:timeSeries": timeseries_entries,
-        "datacellar:datasetMetadata": [
-            {
-                "@type": "datacellar:GeoLocalizedDataset",
-                "datacellar:latitude": BIMENES_LATITUDE,
-                "datacellar:longitude": BIMENES_LONGITUDE,
-            },
-            {
-                "@type": "datacellar:Installation",
-                "datacellar:installationType": "localEnergyCommunity",
-                "datacellar:capacity": 100.0,
-                "datacellar:capacityUnit": "kW",
-            },
-        ],
+        "datacellar:datasetMetadata": _CONSUMPTION_DATASET_METADATA,
     }
 
     return dataset_definition
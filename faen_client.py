@@ -3,21 +3,80 @@
 FAEN API Client for authentication and data retrieval
 """
 
+import copy
+import hashlib
 import json
+import os
+import threading
 import time
 import requests
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Any, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 
-from console_utils import print_section, print_info, print_success, print_error, print_data, print_warning
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+import json_utils
+from console_utils import print_section, print_info, print_success, print_error, print_data, print_data_lines, print_warning
 from mrae import MRAEClient
 
+# Tokens are refreshed this many seconds before they expire
+TOKEN_EXPIRY_MARGIN = 5
+
+# Lifetime assumed when the token response has no expires_in
+DEFAULT_TOKEN_LIFETIME = 3600
+
+_ONE_DAY = timedelta(days=1)
+
+# Seconds that query results are reused for identical queries
+DEFAULT_CACHE_TTL = 300
+
+# Request headers are never mutated by requests, so they can be shared
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+# How each FAEN query endpoint is requested: url_attr names the client attribute
+# holding the endpoint URL and date_field the query field used for chunking
+_EndpointSpec = namedtuple('_EndpointSpec', 'name url_attr method icon label date_field')
+_CONSUMPTION_SPEC = _EndpointSpec('consumption', '_consumption_url', 'POST', '📊', 'Consumption', 'datetime')
+_GENERATION_SPEC = _EndpointSpec('generation', '_generation_url', 'GET', '⚡', 'Generation', 'datetime')
+_WEATHER_SPEC = _EndpointSpec('weather', '_weather_url', 'GET', '🌤️', 'Weather', 'datetime_utc')
+
+# Shared by every client's session so keep-alive connections (and their TLS
+# handshakes) are reused across FaenApiClient instances. FAEN queries are
+# reads, so POSTs are retried on transient gateway errors too; the final
+# response is still returned (raise_on_status=False) for error reporting
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=['GET', 'POST'],
+        raise_on_status=False
+    )
+)
+
 
 class FaenApiClient:
     """Client for interacting with the FAEN API"""
     
-    def __init__(self, base_url: str, username: str, password: str):
+    # Date ranges longer than CHUNK_DAYS are split into chunks of that many
+    # days, with up to CHUNK_WORKERS chunk requests in flight at once
+    CHUNK_DAYS = 10
+    CHUNK_WORKERS = 4
+    # Most recently used (ETag, payload) pairs kept for conditional requests;
+    # enough for the chunks of a few long-range queries, not a full history
+    ETAG_STORE_SIZE = 8 * CHUNK_WORKERS
+    
+    def __init__(self, base_url: str, username: str, password: str, cache_token: bool = True,
+                 cache_ttl_seconds: float = DEFAULT_CACHE_TTL, verbose: bool = True):
         """
         Initialize the FAEN API client
         
@@ -25,26 +84,172 @@ class FaenApiClient:
             base_url: Base URL of the FAEN API
             username: Username for authentication
             password: Password for authentication
+            cache_token: Reuse access tokens across runs via an on-disk cache
+            cache_ttl_seconds: How long query results are reused for identical
+                queries (0 disables the result cache)
+            verbose: Print request details and per-chunk progress; section
+                headers, results, warnings and errors are always printed
         """
         self.base_url = base_url.rstrip('/')
+        
+        # Endpoint URLs are fixed for the lifetime of the client
+        base = self.base_url + '/'
+        self._token_url = urljoin(base, 'token')
+        self._consumption_url = urljoin(base, 'consumption/query')
+        self._generation_url = urljoin(base, 'generation/')
+        self._weather_url = urljoin(base, 'weather/')
+        self._user_url = urljoin(base, 'users/me/')
+        
         self.username = username
         self.password = password
+        self.cache_token = cache_token
+        self.verbose = verbose
         self.access_token: Optional[str] = None
         self.token_type: str = "Bearer"
+        # time.monotonic() value after which the token must be refreshed
+        self._token_refresh_at: float = 0.0
+        # Serializes token refreshes when queries run on several threads
+        self._auth_lock = threading.Lock()
+        # Query results keyed by _query_cache_key, as (time.monotonic(), records)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._result_cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+        # Futures of queries currently running, so concurrent duplicates share one request
+        self._inflight: Dict[Tuple, Future] = {}
+        self._cache_lock = threading.Lock()
+        # Per-thread flag set by query_all while queries run concurrently
+        self._local = threading.local()
+        # (ETag, decoded payload) of past responses, keyed like _result_cache,
+        # least recently used first; guarded by _cache_lock
+        self._etag_store: 'OrderedDict[Tuple, Tuple[str, Any]]' = OrderedDict()
+        # Each client keeps its own session (and Authorization header) but
+        # shares the connection pool
         self.session = requests.Session()
+        self.session.mount('http://', _HTTP_ADAPTER)
+        self.session.mount('https://', _HTTP_ADAPTER)
+    
+    def close(self):
+        """
+        Close the HTTP session and its keep-alive connections
+        
+        The connection pool is shared, so other clients reconnect on their next request.
+        """
+        self.session.close()
+    
+    def _token_cache_path(self) -> Path:
+        """
+        Get the token cache file for this API and user
+        
+        Returns:
+            Path under $XDG_CACHE_HOME (or ~/.cache)/faen-injector
+        """
+        cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        key = hashlib.sha256(f"{self.base_url}\0{self.username}".encode('utf-8')).hexdigest()[:16]
+        return Path(cache_home) / 'faen-injector' / f'token-{key}.json'
+    
+    def _set_token(self, access_token: str, token_type: str, expires_in: float):
+        """
+        Store an access token and use it for future requests
+        
+        Args:
+            access_token: OAuth2 access token
+            token_type: Token type (e.g. "Bearer")
+            expires_in: Seconds until the token expires
+        """
+        self.access_token = access_token
+        self.token_type = token_type
+        self._token_refresh_at = time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN
+        
+        # Set authorization header for future requests
+        self.session.headers.update({
+            'Authorization': f'{self.token_type} {self.access_token}'
+        })
+    
+    def _load_cached_token(self) -> bool:
+        """
+        Load a still-valid access token from the on-disk cache
+        
+        Returns:
+            True if a cached token was loaded, False otherwise
+        """
+        try:
+            with open(self._token_cache_path(), encoding='utf-8') as f:
+                cached = json.load(f)
+            expires_in = cached['expires_at'] - time.time()
+            if expires_in <= TOKEN_EXPIRY_MARGIN:
+                return False
+            self._set_token(cached['access_token'], cached.get('token_type', 'Bearer'), expires_in)
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, unreadable or malformed cache: authenticate normally
+            return False
+    
+    def _save_cached_token(self, expires_in: float):
+        """
+        Write the current access token to the on-disk cache
+        
+        The file is only readable by the current user and is replaced
+        atomically, so concurrent runs never see a partial file.
+        
+        Args:
+            expires_in: Seconds until the token expires
+        """
+        cache_path = self._token_cache_path()
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'access_token': self.access_token,
+                    'token_type': self.token_type,
+                    'expires_at': time.time() + expires_in,
+                }, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            # The cache is only an optimization; never fail authentication over it
+            print_warning(f"⚠ Could not cache access token: {e}")
+    
+    def _ensure_token(self):
+        """
+        Make sure a valid access token is available, refreshing it shortly before it expires
+        
+        Raises:
+            Exception: If authentication fails
+        """
+        if self.access_token and time.monotonic() < self._token_refresh_at:
+            return
+        with self._auth_lock:
+            # Another thread may have refreshed the token while we waited
+            if self.access_token and time.monotonic() < self._token_refresh_at:
+                return
+            if not self.authenticate(force=self.access_token is not None):
+                raise Exception("Authentication required before making API calls")
     
-    def authenticate(self) -> bool:
+    def authenticate(self, force: bool = False) -> bool:
         """
         Authenticate with the FAEN API using OAuth2 password flow
         
+        A still-valid token from the on-disk cache is reused unless force is set
+        or token caching is disabled.
+        
+        Args:
+            force: Request a new token even if a cached one is available
+        
         Returns:
             True if authentication successful, False otherwise
         """
         print_section("🔐 Authentication")
         print_info(f"Authenticating as: {self.username}")
         
-        token_url = urljoin(self.base_url + '/', 'token')
-        print_data("Token URL", token_url, 1)
+        if self.cache_token and not force and self._load_cached_token():
+            print_success("✓ Using cached access token")
+            if self.verbose:
+                print_data("Token cache", str(self._token_cache_path()), 1)
+            return True
+        
+        token_url = self._token_url
+        if self.verbose:
+            print_data("Token URL", token_url, 1)
         
         # Prepare form data for OAuth2 password flow
         auth_data = {
@@ -53,31 +258,30 @@ class FaenApiClient:
             'grant_type': 'password'
         }
         
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded'
-        }
-        
         try:
-            print_info("Sending authentication request...")
+            if self.verbose:
+                print_info("Sending authentication request...")
             response = self.session.post(
                 token_url,
                 data=auth_data,
-                headers=headers
+                headers=_FORM_HEADERS
             )
             response.raise_for_status()
             
-            token_data = response.json()
-            self.access_token = token_data['access_token']
-            self.token_type = token_data.get('token_type', 'Bearer')
-            
-            # Set authorization header for future requests
-            self.session.headers.update({
-                'Authorization': f'{self.token_type} {self.access_token}'
-            })
+            token_data = json_utils.response_json(response)
+            expires_in = float(token_data.get('expires_in') or DEFAULT_TOKEN_LIFETIME)
+            self._set_token(
+                token_data['access_token'],
+                token_data.get('token_type', 'Bearer'),
+                expires_in
+            )
+            if self.cache_token:
+                self._save_cached_token(expires_in)
             
             print_success(f"✓ Authentication successful!")
-            print_data("Token type", self.token_type, 1)
-            print_data("Token preview", f"{self.access_token[:20]}...{self.access_token[-10:]}", 1)
+            if self.verbose:
+                print_data("Token type", self.token_type, 1)
+                print_data("Token preview", f"{self.access_token[:20]}...{self.access_token[-10:]}", 1)
             return True
             
         except requests.exceptions.RequestException as e:
@@ -87,224 +291,271 @@ class FaenApiClient:
                 print_data("Response content", e.response.text[:200], 1)
             return False
     
-    def query_consumption(self, 
-                         query: Dict[str, Any], 
-                         limit: int = 100, 
-                         sort: Optional[str] = None,
-                         eumed: bool = False) -> List[Dict[str, Any]]:
+    def _cached_query(self,
+                      key: Tuple,
+                      fetch: Callable[[], List[Dict[str, Any]]],
+                      use_cache: bool) -> List[Dict[str, Any]]:
         """
-        Query consumption data using POST request with automatic chunking for large date ranges
+        Return the records for a query, reusing results fetched within the cache TTL
+        
+        Identical queries issued concurrently from several threads are coalesced:
+        the first caller runs the request and the others wait for its result.
         
         Args:
-            query: MongoDB query document
-            limit: Maximum number of results to return per chunk
-            sort: Sort key (e.g., "+datetime")
-            eumed: Whether to return EUMED-compliant JSON-LD format
+            key: Cache key built with _query_cache_key
+            fetch: Runs the query and returns its records
+            use_cache: Whether cached or in-flight results may be used and stored
             
         Returns:
-            List of consumption data records
+            List of records (a new list, so callers may modify it)
         """
-        if not self.access_token:
-            if not self.authenticate():
-                raise Exception("Authentication required before making API calls")
+        if not use_cache:
+            return fetch()
         
-        print_section("📊 Querying Consumption Data")
-        consumption_url = urljoin(self.base_url + '/', 'consumption/query')
-        print_data("Endpoint", consumption_url, 1)
-        
-        # Check if this is a large date range query that needs chunking
-        datetime_range = query.get('datetime', {})
-        if isinstance(datetime_range, dict) and '$gte' in datetime_range and '$lt' in datetime_range:
-            # Extract start and end dates from query
-            start_date_str = datetime_range['$gte']['$date']
-            end_date_str = datetime_range['$lt']['$date']
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl_seconds:
+                print_success(f"✓ Using {len(cached[1])} cached {key[0]} records")
+                return list(cached[1])
             
-            try:
-                start_date = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
-                end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                
-                # If date range is more than 10 days, use automatic chunking
-                date_diff = end_date - start_date
-                if date_diff.days > 10:
-                    return self._query_consumption_chunked(
-                        consumption_url, query, limit, sort, eumed, 
-                        start_date, end_date
-                    )
-            except (ValueError, TypeError):
-                # If date parsing fails, proceed with single request
-                print_warning("⚠ Could not parse date range, proceeding with single request")
-        
-        # Original single request logic
-        request_body = {
-            'query': query,
-            'limit': limit,
-            'eumed': eumed
-        }
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight[key] = Future()
         
-        if sort:
-            request_body['sort'] = sort
-            print_data("Sort order", sort, 1)
-        
-        print_data("Limit", str(limit), 1)
-        print_data("EUMED format", str(eumed), 1)
-        
-        headers = {
-            'Content-Type': 'application/json'
-        }
+        if not is_leader:
+            print_info(f"Waiting for identical {key[0]} query already in progress...")
+            return list(future.result())
         
         try:
-            print_info("Sending query request...")
-            response = self.session.post(
-                consumption_url,
-                json=request_body,
-                headers=headers
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            record_count = len(data) if isinstance(data, list) else 1
-            print_success(f"✓ Retrieved {record_count} consumption records")
-            return data
-            
-        except requests.exceptions.RequestException as e:
-            print_error(f"Failed to query consumption data: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print_data("Response status", str(e.response.status_code), 1)
-                print_data("Response content", e.response.text[:200], 1)
+            records = fetch()
+        except BaseException as e:
+            with self._cache_lock:
+                del self._inflight[key]
+            future.set_exception(e)
             raise
+        
+        with self._cache_lock:
+            del self._inflight[key]
+            if self.cache_ttl_seconds > 0:
+                now = time.monotonic()
+                # Drop expired entries so the cache doesn't grow over long sessions
+                for stale_key in [k for k, (stored_at, _) in self._result_cache.items()
+                                  if now - stored_at >= self.cache_ttl_seconds]:
+                    del self._result_cache[stale_key]
+                self._result_cache[key] = (now, records)
+        future.set_result(records)
+        return list(records)
     
-    def _query_consumption_chunked(self,
-                                  consumption_url: str,
-                                  base_query: Dict[str, Any],
-                                  limit: int,
-                                  sort: Optional[str],
-                                  eumed: bool,
-                                  start_date: datetime,
-                                  end_date: datetime) -> List[Dict[str, Any]]:
+    def _show_progress(self) -> bool:
         """
-        Execute chunked consumption queries for large date ranges (10-day chunks)
+        Whether per-query progress is printed in the current thread
+        
+        query_all turns it off in its worker threads, whose output would
+        otherwise interleave. Errors are always printed.
+        """
+        return not getattr(self._local, 'quiet', False)
+    
+    def invalidate_cache(self):
+        """
+        Discard all cached query results and stored ETags
+        """
+        with self._cache_lock:
+            self._result_cache.clear()
+            self._etag_store.clear()
+    
+    def _iter_chunked_queries(self,
+                             base_query: Dict[str, Any],
+                             date_field: str,
+                             start_date: datetime,
+                             end_date: datetime,
+                             request_chunk: Callable[[Dict[str, Any]], Any],
+                             label: str) -> Iterator[Dict[str, Any]]:
+        """
+        Split a date range query into chunks and request them concurrently
+        
+        Records are yielded chunk by chunk as soon as each chunk (and every
+        chunk before it) has arrived, so callers can start processing early.
         
         Args:
-            consumption_url: API endpoint URL
             base_query: Base MongoDB query document
-            limit: Maximum number of results to return per chunk  
-            sort: Sort key (e.g., "+datetime")
-            eumed: Whether to return EUMED-compliant JSON-LD format
+            date_field: Query field holding the date range (e.g. "datetime")
             start_date: Overall start date for the range
             end_date: Overall end date for the range
+            request_chunk: Sends the request for one chunk query and returns the decoded response
+            label: Endpoint label used to tell chunk messages of concurrent queries apart
             
-        Returns:
-            Combined list of consumption data records from all chunks
+        Yields:
+            Records from all chunks, in chunk order
         """
-        all_records = []
-        current_date = start_date
-        chunk_size_days = 10
-        total_chunks = 0
+        chunks = list(_iter_date_chunks(start_date, end_date, self.CHUNK_DAYS))
         
-        print_info(f"🔄 Large date range detected ({(end_date - start_date).days} days)")
-        print_info(f"🔄 Using automatic 10-day chunking...")
+        show_progress = self._show_progress()
+        show_chunks = show_progress and self.verbose
+        if show_progress:
+            print_info(f"🔄 Large date range detected ({(end_date - start_date).days} days)")
+            print_info(f"🔄 Using automatic {self.CHUNK_DAYS}-day chunking "
+                       f"({len(chunks)} chunks, up to {self.CHUNK_WORKERS} at a time)...")
         
-        headers = {
-            'Content-Type': 'application/json'
-        }
-        
-        while current_date < end_date:
-            # Calculate chunk end date (10 days or remaining time, whichever is smaller)
-            chunk_end_date = min(current_date + timedelta(days=chunk_size_days), end_date)
-            total_chunks += 1
-            
-            # Display the original end date for the last chunk to avoid confusion
-            if chunk_end_date == end_date:
-                # For the last chunk, show the original user-specified end date (exclusive)
-                original_end_user_date = (end_date - timedelta(days=1)).strftime('%Y-%m-%d')
-                display_text = f"{current_date.strftime('%Y-%m-%d')} to {original_end_user_date} (exclusive)"
-            else:
-                display_text = f"{current_date.strftime('%Y-%m-%d')} to {chunk_end_date.strftime('%Y-%m-%d')}"
-            
-            print_data(f"Chunk {total_chunks}", display_text, 1)
-            
+        def fetch_chunk(chunk: Tuple[datetime, datetime]) -> Tuple[Any, Optional[Exception]]:
+            chunk_start, chunk_end = chunk
             # Create chunk-specific query
             chunk_query = base_query.copy()
-            chunk_query['datetime'] = {
-                '$gte': {'$date': current_date.isoformat()},
-                '$lt': {'$date': chunk_end_date.isoformat()}
+            chunk_query[date_field] = {
+                '$gte': {'$date': chunk_start.isoformat()},
+                '$lt': {'$date': chunk_end.isoformat()}
             }
-            
-            request_body = {
-                'query': chunk_query,
-                'limit': limit,
-                'eumed': eumed
-            }
-            
-            if sort:
-                request_body['sort'] = sort
-            
             try:
-                print_info(f"  📡 Requesting chunk {total_chunks}...")
-                response = self.session.post(
-                    consumption_url,
-                    json=request_body,
-                    headers=headers
-                )
-                response.raise_for_status()
+                return request_chunk(chunk_query), None
+            except requests.exceptions.RequestException as e:
+                return None, e
+        
+        total_records = 0
+        with ThreadPoolExecutor(max_workers=min(self.CHUNK_WORKERS, len(chunks))) as executor:
+            # map() yields results in chunk order, so records stay sorted by date
+            results = executor.map(fetch_chunk, chunks)
+            for chunk_number, ((chunk_start, chunk_end), (chunk_data, error)) in enumerate(zip(chunks, results), 1):
+                if show_chunks:
+                    # Display the original end date for the last chunk to avoid confusion
+                    if chunk_end == end_date:
+                        # For the last chunk, show the original user-specified end date (exclusive)
+                        original_end_user_date = (end_date - _ONE_DAY).strftime('%Y-%m-%d')
+                        display_text = f"{chunk_start.strftime('%Y-%m-%d')} to {original_end_user_date} (exclusive)"
+                    else:
+                        display_text = f"{chunk_start.strftime('%Y-%m-%d')} to {chunk_end.strftime('%Y-%m-%d')}"
                 
-                chunk_data = response.json()
-                chunk_record_count = len(chunk_data) if isinstance(chunk_data, list) else 1
+                    print_data(f"Chunk {chunk_number}", display_text, 1)
                 
+                if error is not None:
+                    print_error(f"  ✗ Failed to retrieve {label} chunk {chunk_number} "
+                                f"({chunk_start.strftime('%Y-%m-%d')} to {chunk_end.strftime('%Y-%m-%d')}): {error}")
+                    if hasattr(error, 'response') and error.response is not None:
+                        print_data("    Response status", str(error.response.status_code), 1)
+                        print_data("    Response content", error.response.text[:200], 1)
+                    
+                    # For robustness, continue with next chunk instead of failing completely
+                    print_warning(f"  → Continuing with next {label} chunk...")
+                    continue
+                
+                chunk_record_count = len(chunk_data) if isinstance(chunk_data, list) else 1
                 if chunk_record_count > 0:
-                    all_records.extend(chunk_data)
-                    print_success(f"  ✓ Retrieved {chunk_record_count} records")
-                else:
+                    total_records += chunk_record_count
+                    if show_chunks:
+                        print_success(f"  ✓ Retrieved {chunk_record_count} records")
+                    yield from chunk_data
+                elif show_chunks:
                     print_info(f"  ✓ No data for this period")
-                
-            except requests.exceptions.RequestException as e:
-                print_error(f"  ✗ Failed to retrieve chunk {total_chunks}: {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    print_data("    Response status", str(e.response.status_code), 1)
-                    print_data("    Response content", e.response.text[:200], 1)
-                
-                # For robustness, continue with next chunk instead of failing completely
-                print_warning("  → Continuing with next chunk...")
+        
+        if show_progress:
+            print_success(f"✓ Completed chunked {label.lower()} query: {total_records} total records "
+                          f"from {len(chunks)} chunks")
+    
+    def _fetch_query(self,
+                     spec: '_EndpointSpec',
+                     query: Dict[str, Any],
+                     limit: int,
+                     sort: Optional[str],
+                     extra: Dict[str, Any],
+                     reauthenticated: bool = False) -> Any:
+        """
+        Send one query request to an endpoint and decode the response
+        
+        When the endpoint returned an ETag for the same request earlier, it is sent
+        back as If-None-Match and a 304 Not Modified reuses a copy of the stored payload.
+        A 401 response (e.g. a cached token revoked before it expired) triggers one
+        fresh authentication and a retry.
+        
+        Args:
+            spec: Endpoint to query
+            query: MongoDB query document
+            limit: Maximum number of results to return
+            sort: Sort key (e.g., "+datetime")
+            extra: Additional endpoint parameters (e.g. eumed)
+            reauthenticated: Whether this is the retry after a 401 response
             
-            # Move to next chunk
-            current_date = chunk_end_date
+        Returns:
+            Decoded JSON response
             
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.1)
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        url = getattr(self, spec.url_attr)
+        etag_key = _query_cache_key(spec.name, query, limit, sort, *extra.values())
+        with self._cache_lock:
+            stored = self._etag_store.get(etag_key)
+            if stored is not None:
+                self._etag_store.move_to_end(etag_key)
+        sent_token = self.access_token
+        
+        if spec.method == 'POST':
+            request_body = {'query': query, 'limit': limit, **extra}
+            if sort:
+                request_body['sort'] = sort
+            headers = _JSON_HEADERS if stored is None else {**_JSON_HEADERS, 'If-None-Match': stored[0]}
+            response = self.session.post(url, data=json_utils.dumps(request_body), headers=headers)
+        else:
+            params = {
+                'query': json_utils.dumps(query).decode('utf-8'),
+                'limit': limit,
+                **extra
+            }
+            if sort:
+                params['sort'] = sort
+            headers = None if stored is None else {'If-None-Match': stored[0]}
+            response = self.session.get(url, params=params, headers=headers)
         
-        total_records = len(all_records)
-        print_success(f"✓ Completed chunked query: {total_records} total records from {total_chunks} chunks")
+        if response.status_code == 304 and stored is not None:
+            # Callers own the payload they get back; never hand out the stored one
+            return copy.copy(stored[1])
+        if response.status_code == 401 and not reauthenticated:
+            with self._auth_lock:
+                # Another thread may already have replaced the rejected token
+                if self.access_token == sent_token and not self.authenticate(force=True):
+                    response.raise_for_status()
+            return self._fetch_query(spec, query, limit, sort, extra, True)
+        response.raise_for_status()
         
-        return all_records
+        data = json_utils.response_json(response)
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._cache_lock:
+                self._etag_store[etag_key] = (etag, copy.copy(data))
+                self._etag_store.move_to_end(etag_key)
+                if len(self._etag_store) > self.ETAG_STORE_SIZE:
+                    self._etag_store.popitem(last=False)
+        return data
     
-    def query_generation(self, 
-                        query: Dict[str, Any], 
-                        limit: int = 100, 
-                        sort: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _iter_query(self,
+                    spec: '_EndpointSpec',
+                    query: Dict[str, Any],
+                    limit: int,
+                    sort: Optional[str],
+                    **extra: Any) -> Iterator[Dict[str, Any]]:
         """
-        Query generation data using GET request with automatic chunking for large date ranges
+        Iterate over the records of a query with automatic chunking for large date ranges
         
         Args:
+            spec: Endpoint to query
             query: MongoDB query document
             limit: Maximum number of results to return per chunk
             sort: Sort key (e.g., "+datetime")
+            **extra: Additional endpoint parameters (e.g. eumed)
             
-        Returns:
-            List of generation data records
+        Yields:
+            Data records, chunk by chunk for large date ranges
         """
-        if not self.access_token:
-            if not self.authenticate():
-                raise Exception("Authentication required before making API calls")
+        self._ensure_token()
         
-        print_section("⚡ Querying Generation Data")
-        generation_url = urljoin(self.base_url + '/', 'generation/')
-        print_data("Endpoint", generation_url, 1)
+        show_progress = self._show_progress()
+        if show_progress:
+            print_section(f"{spec.icon} Querying {spec.label} Data")
+            if self.verbose:
+                print_data("Endpoint", getattr(self, spec.url_attr), 1)
         
         # Check if this is a large date range query that needs chunking
-        datetime_range = query.get('datetime', {})
+        chunked_records = None
+        datetime_range = query.get(spec.date_field, {})
         if isinstance(datetime_range, dict) and '$gte' in datetime_range and '$lt' in datetime_range:
-            from datetime import datetime, timedelta
-            
             # Extract start and end dates from query
             start_date_str = datetime_range['$gte']['$date']
             end_date_str = datetime_range['$lt']['$date']
@@ -313,150 +564,157 @@ class FaenApiClient:
                 start_date = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
                 end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
                 
-                # If date range is more than 10 days, use automatic chunking
+                # If date range is more than CHUNK_DAYS days, use automatic chunking
                 date_diff = end_date - start_date
-                if date_diff.days > 10:
-                    return self._query_generation_chunked(
-                        generation_url, query, limit, sort,
-                        start_date, end_date
+                if date_diff.days > self.CHUNK_DAYS:
+                    chunked_records = self._iter_chunked_queries(
+                        query, spec.date_field, start_date, end_date,
+                        lambda chunk_query: self._fetch_query(spec, chunk_query, limit, sort, extra),
+                        spec.label
                     )
             except (ValueError, TypeError):
                 # If date parsing fails, proceed with single request
-                print_warning("⚠ Could not parse date range, proceeding with single request")
+                print_warning(f"⚠ Could not parse {spec.name} date range, proceeding with single request")
         
-        # Original single request logic
-        params = {
-            'query': json.dumps(query),
-            'limit': limit
-        }
-        
-        if sort:
-            params['sort'] = sort
-            print_data("Sort order", sort, 1)
+        if chunked_records is not None:
+            yield from chunked_records
+            return
         
-        print_data("Limit", str(limit), 1)
+        # Single request for short date ranges
+        if show_progress and self.verbose:
+            if sort:
+                print_data("Sort order", sort, 1)
+            print_data("Limit", str(limit), 1)
+            if 'eumed' in extra:
+                print_data("EUMED format", str(extra['eumed']), 1)
+            print_info("Sending query request...")
         
         try:
-            print_info("Sending query request...")
-            response = self.session.get(
-                generation_url,
-                params=params
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            record_count = len(data) if isinstance(data, list) else 1
-            print_success(f"✓ Retrieved {record_count} generation records")
-            return data
+            data = self._fetch_query(spec, query, limit, sort, extra)
+            if show_progress:
+                record_count = len(data) if isinstance(data, list) else 1
+                print_success(f"✓ Retrieved {record_count} {spec.name} records")
             
         except requests.exceptions.RequestException as e:
-            print_error(f"Failed to query generation data: {e}")
+            print_error(f"Failed to query {spec.name} data: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 print_data("Response status", str(e.response.status_code), 1)
                 print_data("Response content", e.response.text[:200], 1)
             raise
+        
+        if isinstance(data, list):
+            yield from data
+        else:
+            yield data
     
-    def _query_generation_chunked(self,
-                                  generation_url: str,
-                                  base_query: Dict[str, Any],
-                                  limit: int,
-                                  sort: Optional[str],
-                                  start_date: datetime,
-                                  end_date: datetime) -> List[Dict[str, Any]]:
+    def _query(self,
+               spec: '_EndpointSpec',
+               query: Dict[str, Any],
+               limit: int,
+               sort: Optional[str],
+               use_cache: bool,
+               **extra: Any) -> List[Dict[str, Any]]:
         """
-        Execute chunked generation queries for large date ranges (10-day chunks)
+        Query an endpoint, reusing cached or in-flight results of identical queries
         
         Args:
-            generation_url: API endpoint URL
-            base_query: Base MongoDB query document
-            limit: Maximum number of results to return per chunk  
+            spec: Endpoint to query
+            query: MongoDB query document
+            limit: Maximum number of results to return per chunk
             sort: Sort key (e.g., "+datetime")
-            start_date: Overall start date for the range
-            end_date: Overall end date for the range
+            use_cache: Reuse results of an identical query made within cache_ttl_seconds
+            **extra: Additional endpoint parameters (e.g. eumed)
             
         Returns:
-            Combined list of generation data records from all chunks
+            List of data records
         """
-        all_records = []
-        current_date = start_date
-        chunk_size_days = 10
-        total_chunks = 0
-        
-        print_info(f"🔄 Large date range detected ({(end_date - start_date).days} days)")
-        print_info(f"🔄 Using automatic 10-day chunking...")
+        return self._cached_query(
+            _query_cache_key(spec.name, query, limit, sort, *extra.values()),
+            lambda: list(self._iter_query(spec, query, limit, sort, **extra)),
+            use_cache
+        )
+    
+    def query_consumption(self, 
+                         query: Dict[str, Any], 
+                         limit: int = 100, 
+                         sort: Optional[str] = None,
+                         eumed: bool = False,
+                         use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Query consumption data using POST request with automatic chunking for large date ranges
         
-        while current_date < end_date:
-            # Calculate chunk end date (10 days or remaining time, whichever is smaller)
-            chunk_end_date = min(current_date + timedelta(days=chunk_size_days), end_date)
-            total_chunks += 1
-            
-            # Display the original end date for the last chunk to avoid confusion
-            if chunk_end_date == end_date:
-                # For the last chunk, show the original user-specified end date (exclusive)
-                original_end_user_date = (end_date - timedelta(days=1)).strftime('%Y-%m-%d')
-                display_text = f"{current_date.strftime('%Y-%m-%d')} to {original_end_user_date} (exclusive)"
-            else:
-                display_text = f"{current_date.strftime('%Y-%m-%d')} to {chunk_end_date.strftime('%Y-%m-%d')}"
-            
-            print_data(f"Chunk {total_chunks}", display_text, 1)
-            
-            # Create chunk-specific query
-            chunk_query = base_query.copy()
-            chunk_query['datetime'] = {
-                '$gte': {'$date': current_date.isoformat()},
-                '$lt': {'$date': chunk_end_date.isoformat()}
-            }
-            
-            # Prepare URL parameters
-            params = {
-                'query': json.dumps(chunk_query),
-                'limit': limit
-            }
-            
-            if sort:
-                params['sort'] = sort
-            
-            try:
-                print_info(f"  📡 Requesting chunk {total_chunks}...")
-                response = self.session.get(
-                    generation_url,
-                    params=params
-                )
-                response.raise_for_status()
-                
-                chunk_data = response.json()
-                chunk_record_count = len(chunk_data) if isinstance(chunk_data, list) else 1
-                
-                if chunk_record_count > 0:
-                    all_records.extend(chunk_data)
-                    print_success(f"  ✓ Retrieved {chunk_record_count} records")
-                else:
-                    print_info(f"  ✓ No data for this period")
-                
-            except requests.exceptions.RequestException as e:
-                print_error(f"  ✗ Failed to retrieve chunk {total_chunks}: {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    print_data("    Response status", str(e.response.status_code), 1)
-                    print_data("    Response content", e.response.text[:200], 1)
-                
-                # For robustness, continue with next chunk instead of failing completely
-                print_warning("  → Continuing with next chunk...")
+        Args:
+            query: MongoDB query document
+            limit: Maximum number of results to return per chunk
+            sort: Sort key (e.g., "+datetime")
+            eumed: Whether to return EUMED-compliant JSON-LD format
+            use_cache: Reuse results of an identical query made within cache_ttl_seconds
             
-            # Move to next chunk
-            current_date = chunk_end_date
+        Returns:
+            List of consumption data records
+        """
+        return self._query(_CONSUMPTION_SPEC, query, limit, sort, use_cache, eumed=eumed)
+    
+    def iter_consumption(self, 
+                        query: Dict[str, Any], 
+                        limit: int = 100, 
+                        sort: Optional[str] = None,
+                        eumed: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over consumption data records using POST request with automatic chunking for large date ranges
+        
+        Args:
+            query: MongoDB query document
+            limit: Maximum number of results to return per chunk
+            sort: Sort key (e.g., "+datetime")
+            eumed: Whether to return EUMED-compliant JSON-LD format
             
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.1)
+        Returns:
+            Iterator over consumption data records, fetched chunk by chunk for large date ranges
+        """
+        return self._iter_query(_CONSUMPTION_SPEC, query, limit, sort, eumed=eumed)
+    
+    def query_generation(self, 
+                        query: Dict[str, Any], 
+                        limit: int = 100, 
+                        sort: Optional[str] = None,
+                        use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Query generation data using GET request with automatic chunking for large date ranges
         
-        total_records = len(all_records)
-        print_success(f"✓ Completed chunked query: {total_records} total records from {total_chunks} chunks")
+        Args:
+            query: MongoDB query document
+            limit: Maximum number of results to return per chunk
+            sort: Sort key (e.g., "+datetime")
+            use_cache: Reuse results of an identical query made within cache_ttl_seconds
+            
+        Returns:
+            List of generation data records
+        """
+        return self._query(_GENERATION_SPEC, query, limit, sort, use_cache)
+    
+    def iter_generation(self, 
+                       query: Dict[str, Any], 
+                       limit: int = 100, 
+                       sort: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over generation data records using GET request with automatic chunking for large date ranges
         
-        return all_records
+        Args:
+            query: MongoDB query document
+            limit: Maximum number of results to return per chunk
+            sort: Sort key (e.g., "+datetime")
+            
+        Returns:
+            Iterator over generation data records, fetched chunk by chunk for large date ranges
+        """
+        return self._iter_query(_GENERATION_SPEC, query, limit, sort)
     
     def query_weather(self, 
                      query: Dict[str, Any], 
                      limit: int = 100, 
-                     sort: Optional[str] = None) -> List[Dict[str, Any]]:
+                     sort: Optional[str] = None,
+                     use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         Query weather data using GET request with automatic chunking for large date ranges
         
@@ -464,168 +722,96 @@ class FaenApiClient:
             query: MongoDB query document
             limit: Maximum number of results to return per chunk
             sort: Sort key (e.g., "+datetime")
+            use_cache: Reuse results of an identical query made within cache_ttl_seconds
             
         Returns:
             List of weather data records
         """
-        if not self.access_token:
-            if not self.authenticate():
-                raise Exception("Authentication required before making API calls")
-        
-        print_section("🌤️ Querying Weather Data")
-        weather_url = urljoin(self.base_url + '/', 'weather/')
-        print_data("Endpoint", weather_url, 1)
-        
-        # Check if this is a large date range query that needs chunking
-        datetime_range = query.get('datetime_utc', {})
-        if isinstance(datetime_range, dict) and '$gte' in datetime_range and '$lt' in datetime_range:
-            # Extract start and end dates from query
-            start_date_str = datetime_range['$gte']['$date']
-            end_date_str = datetime_range['$lt']['$date']
-            
-            try:
-                start_date = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
-                end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                
-                # If date range is more than 10 days, use automatic chunking
-                date_diff = end_date - start_date
-                if date_diff.days > 10:
-                    return self._query_weather_chunked(
-                        weather_url, query, limit, sort,
-                        start_date, end_date
-                    )
-            except (ValueError, TypeError):
-                # If date parsing fails, proceed with single request
-                print_warning("⚠ Could not parse date range, proceeding with single request")
-        
-        # Original single request logic
-        params = {
-            'query': json.dumps(query),
-            'limit': limit
-        }
-        
-        if sort:
-            params['sort'] = sort
-            print_data("Sort order", sort, 1)
-        
-        print_data("Limit", str(limit), 1)
-        
-        try:
-            print_info("Sending query request...")
-            response = self.session.get(
-                weather_url,
-                params=params
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            record_count = len(data) if isinstance(data, list) else 1
-            print_success(f"✓ Retrieved {record_count} weather records")
-            return data
-            
-        except requests.exceptions.RequestException as e:
-            print_error(f"Failed to query weather data: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print_data("Response status", str(e.response.status_code), 1)
-                print_data("Response content", e.response.text[:200], 1)
-            raise
+        return self._query(_WEATHER_SPEC, query, limit, sort, use_cache)
     
-    def _query_weather_chunked(self,
-                                weather_url: str,
-                                base_query: Dict[str, Any],
-                                limit: int,
-                                sort: Optional[str],
-                                start_date: datetime,
-                                end_date: datetime) -> List[Dict[str, Any]]:
+    def iter_weather(self, 
+                    query: Dict[str, Any], 
+                    limit: int = 100, 
+                    sort: Optional[str] = None) -> Iterator[Dict[str, Any]]:
         """
-        Execute chunked weather queries for large date ranges (10-day chunks)
+        Iterate over weather data records using GET request with automatic chunking for large date ranges
         
         Args:
-            weather_url: API endpoint URL
-            base_query: Base MongoDB query document
-            limit: Maximum number of results to return per chunk  
+            query: MongoDB query document
+            limit: Maximum number of results to return per chunk
             sort: Sort key (e.g., "+datetime")
-            start_date: Overall start date for the range
-            end_date: Overall end date for the range
             
         Returns:
-            Combined list of weather data records from all chunks
+            Iterator over weather data records, fetched chunk by chunk for large date ranges
+        """
+        return self._iter_query(_WEATHER_SPEC, query, limit, sort)
+    
+    def query_all(self,
+                  consumption: Optional[Dict[str, Any]] = None,
+                  generation: Optional[Dict[str, Any]] = None,
+                  weather: Optional[Dict[str, Any]] = None,
+                  mrae: Optional[Dict[str, Any]] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
-        all_records = []
-        current_date = start_date
-        chunk_size_days = 10
-        total_chunks = 0
+        Query several FAEN endpoints concurrently
         
-        print_info(f"🔄 Large date range detected ({(end_date - start_date).days} days)")
-        print_info(f"🔄 Using automatic 10-day chunking...")
+        The requests are I/O bound, so running them on threads makes the total
+        wait roughly that of the slowest query instead of the sum of all of them.
         
-        while current_date < end_date:
-            # Calculate chunk end date (10 days or remaining time, whichever is smaller)
-            chunk_end_date = min(current_date + timedelta(days=chunk_size_days), end_date)
-            total_chunks += 1
-            
-            # Display the original end date for the last chunk to avoid confusion
-            if chunk_end_date == end_date:
-                # For the last chunk, show the original user-specified end date (exclusive)
-                original_end_user_date = (end_date - timedelta(days=1)).strftime('%Y-%m-%d')
-                display_text = f"{current_date.strftime('%Y-%m-%d')} to {original_end_user_date} (exclusive)"
-            else:
-                display_text = f"{current_date.strftime('%Y-%m-%d')} to {chunk_end_date.strftime('%Y-%m-%d')}"
-            
-            print_data(f"Chunk {total_chunks}", display_text, 1)
-            
-            # Create chunk-specific query
-            chunk_query = base_query.copy()
-            chunk_query['datetime_utc'] = {
-                '$gte': {'$date': current_date.isoformat()},
-                '$lt': {'$date': chunk_end_date.isoformat()}
-            }
-            
-            # Prepare URL parameters
-            params = {
-                'query': json.dumps(chunk_query),
-                'limit': limit
-            }
-            
-            if sort:
-                params['sort'] = sort
+        While several queries run, their per-query progress output (section
+        headers, chunk progress) is suppressed so it cannot interleave; a record
+        count per endpoint is printed once all of them have finished. Errors are
+        still printed as they happen, labeled with their endpoint.
+        
+        Args:
+            consumption: Keyword arguments for query_consumption (skipped if None)
+            generation: Keyword arguments for query_generation (skipped if None)
+            weather: Keyword arguments for query_weather (skipped if None)
+            mrae: Keyword arguments for query_mrae (skipped if None)
             
+        Returns:
+            Dictionary mapping "consumption"/"generation"/"weather"/"mrae" to the records
+            of each requested query
+        """
+        # Authenticate up front so the worker threads don't race to do it
+        self._ensure_token()
+        
+        calls = {
+            name: (method, kwargs)
+            for name, method, kwargs in (
+                ("consumption", self.query_consumption, consumption),
+                ("generation", self.query_generation, generation),
+                ("weather", self.query_weather, weather),
+                ("mrae", self.query_mrae, mrae),
+            )
+            if kwargs is not None
+        }
+        if not calls:
+            return {}
+        
+        if len(calls) == 1:
+            # Nothing to overlap; keep the usual progress output
+            (name, (method, kwargs)), = calls.items()
+            return {name: method(**kwargs)}
+        
+        def run_quietly(method: Callable[..., List[Dict[str, Any]]],
+                        kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+            self._local.quiet = True
             try:
-                print_info(f"  📡 Requesting chunk {total_chunks}...")
-                response = self.session.get(
-                    weather_url,
-                    params=params
-                )
-                response.raise_for_status()
-                
-                chunk_data = response.json()
-                chunk_record_count = len(chunk_data) if isinstance(chunk_data, list) else 1
-                
-                if chunk_record_count > 0:
-                    all_records.extend(chunk_data)
-                    print_success(f"  ✓ Retrieved {chunk_record_count} records")
-                else:
-                    print_info(f"  ✓ No data for this period")
-                
-            except requests.exceptions.RequestException as e:
-                print_error(f"  ✗ Failed to retrieve chunk {total_chunks}: {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    print_data("    Response status", str(e.response.status_code), 1)
-                    print_data("    Response content", e.response.text[:200], 1)
-                
-                # For robustness, continue with next chunk instead of failing completely
-                print_warning("  → Continuing with next chunk...")
-            
-            # Move to next chunk
-            current_date = chunk_end_date
-            
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.1)
+                return method(**kwargs)
+            finally:
+                self._local.quiet = False
         
-        total_records = len(all_records)
-        print_success(f"✓ Completed chunked query: {total_records} total records from {total_chunks} chunks")
+        print_section(f"📡 Querying {', '.join(calls)} data concurrently")
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {
+                name: executor.submit(run_quietly, method, kwargs)
+                for name, (method, kwargs) in calls.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
         
-        return all_records
+        print_data_lines(((f"{name.title()} records", len(records))
+                          for name, records in results.items()), 1)
+        return results
     
     def get_current_user(self) -> Dict[str, Any]:
         """
@@ -634,19 +820,17 @@ class FaenApiClient:
         Returns:
             User information dictionary
         """
-        if not self.access_token:
-            if not self.authenticate():
-                raise Exception("Authentication required before making API calls")
+        self._ensure_token()
         
         print_section("👤 User Information")
-        user_url = urljoin(self.base_url + '/', 'users/me/')
+        user_url = self._user_url
         print_data("Endpoint", user_url, 1)
         
         try:
             print_info("Fetching user information...")
             response = self.session.get(user_url)
             response.raise_for_status()
-            user_data = response.json()
+            user_data = json_utils.response_json(response)
             
             print_success("✓ User information retrieved")
             print_data("Username", user_data.get('username', 'Unknown'), 1)
@@ -667,11 +851,9 @@ class FaenApiClient:
         Returns:
             MRAEClient instance configured with this session
         """
-        if not self.access_token:
-            if not self.authenticate():
-                raise Exception("Authentication required before making API calls")
+        self._ensure_token()
         
-        return MRAEClient(self.session, self.base_url)
+        return MRAEClient(self.session, self.base_url, verbose=self._show_progress())
     
     def query_mrae(self, 
                    start_date: Optional[str] = None,
@@ -723,35 +905,92 @@ class FaenApiClient:
         return mrae_client.get_mrae_monthly_summary(year)
 
 
-def create_full_day_query(start_date: Union[date, datetime], end_date: Union[date, datetime]) -> Dict[str, Any]:
+def _query_cache_key(endpoint: str, query: Dict[str, Any], *params: Any) -> Tuple:
     """
-    Create a MongoDB query for full days (00:00:00 to 00:00:00 next day)
+    Build a result cache key that is the same for equal queries regardless of key order
     
     Args:
-        start_date: Start date (date or datetime object) - inclusive
-        end_date: End date (date or datetime object) - exclusive
+        endpoint: Queried endpoint name (e.g. "consumption")
+        query: MongoDB query document
+        *params: Remaining query parameters (limit, sort, ...)
         
     Returns:
-        MongoDB query document with full day ranges
+        Hashable cache key
+    """
+    return (endpoint, json.dumps(query, sort_keys=True, default=str)) + params
+
+
+def _iter_date_chunks(start_date: datetime, end_date: datetime, chunk_days: int) -> Iterator[Tuple[datetime, datetime]]:
     """
-    # Convert to date objects if datetime objects are passed
-    if isinstance(start_date, datetime):
-        start_date = start_date.date()
-    if isinstance(end_date, datetime):
-        end_date = end_date.date()
+    Split a date range into consecutive chunks
     
-    # Create datetime objects for start of start_date and start of day after end_date
-    start_datetime = datetime.combine(start_date, datetime.min.time())
-    end_datetime = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+    Args:
+        start_date: Start of the range (inclusive)
+        end_date: End of the range (exclusive)
+        chunk_days: Maximum chunk length in days
+        
+    Yields:
+        (chunk_start, chunk_end) tuples; the last chunk ends at end_date
+    """
+    step = timedelta(days=chunk_days)
+    current_date = start_date
+    while current_date < end_date:
+        chunk_end_date = min(current_date + step, end_date)
+        yield current_date, chunk_end_date
+        current_date = chunk_end_date
+
+
+def _as_date(value: Union[date, datetime]) -> date:
+    """
+    Convert datetime objects to their date, leaving dates unchanged
+    """
+    return value.date() if isinstance(value, datetime) else value
+
+
+@lru_cache(maxsize=4096)
+def _midnight_iso(day: date) -> str:
+    """
+    Format the start of a day as an ISO timestamp (e.g. "2025-05-01T00:00:00")
+    """
+    # Same string as datetime.combine(day, datetime.min.time()).isoformat()
+    return f"{day.isoformat()}T00:00:00"
+
+
+def _build_range(field: str, start_date: Union[date, datetime], end_date: Union[date, datetime]) -> Dict[str, Any]:
+    """
+    Build a MongoDB query covering full days from start_date up to and including end_date
     
+    Args:
+        field: Datetime field to filter on
+        start_date: Start date (date or datetime object) - inclusive
+        end_date: End date (date or datetime object) - inclusive
+        
+    Returns:
+        MongoDB query document with a [start, end + 1 day) range
+    """
     return {
-        "datetime": {
-            "$gte": {"$date": start_datetime.isoformat()},
-            "$lt": {"$date": end_datetime.isoformat()}  # Use $lt instead of $lte for cleaner boundaries
+        field: {
+            "$gte": {"$date": _midnight_iso(_as_date(start_date))},
+            # Use $lt instead of $lte for cleaner boundaries
+            "$lt": {"$date": _midnight_iso(_as_date(end_date) + _ONE_DAY)}
         }
     }
 
 
+def create_full_day_query(start_date: Union[date, datetime], end_date: Union[date, datetime]) -> Dict[str, Any]:
+    """
+    Create a MongoDB query for full days (00:00:00 to 00:00:00 next day)
+    
+    Args:
+        start_date: Start date (date or datetime object) - inclusive
+        end_date: End date (date or datetime object) - exclusive
+        
+    Returns:
+        MongoDB query document with full day ranges
+    """
+    return _build_range("datetime", start_date, end_date)
+
+
 def create_weather_query(start_date: Union[date, datetime], end_date: Union[date, datetime]) -> Dict[str, Any]:
     """
     Create a MongoDB query for weather data using datetime_utc field
@@ -763,22 +1002,7 @@ def create_weather_query(start_date: Union[date, datetime], end_date: Union[date
     Returns:
         MongoDB query document for weather data
     """
-    # Convert to date objects if datetime objects are passed
-    if isinstance(start_date, datetime):
-        start_date = start_date.date()
-    if isinstance(end_date, datetime):
-        end_date = end_date.date()
-    
-    # Create datetime objects for start of start_date and start of day after end_date
-    start_datetime = datetime.combine(start_date, datetime.min.time())
-    end_datetime = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
-    
-    return {
-        "datetime_utc": {
-            "$gte": {"$date": start_datetime.isoformat()},
-            "$lt": {"$date": end_datetime.isoformat()}
-        }
-    }
+    return _build_range("datetime_utc", start_date, end_date)
 
 
 def create_date_range_query(start_date: str, end_date: str) -> Dict[str, Any]:
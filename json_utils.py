@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+JSON helpers that use orjson when it is installed and fall back to the standard library
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON indented with two spaces
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        # The standard library accepts int/float keys too; keep that parity
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def response_json(response: Any) -> Any:
+    """
+    Parse the JSON body of a requests response with the fastest available decoder
+
+    Falls back to response.json() on malformed bodies so callers still get
+    the requests JSONDecodeError they already handle.
+
+    Args:
+        response: requests.Response (or anything with .content and .json())
+
+    Returns:
+        Parsed Python object
+    """
+    try:
+        return loads(response.content)
+    except ValueError:
+        return response.json()
@@ -6,12 +6,14 @@ Main CLI script that orchestrates the data retrieval and upload workflow
 
 import argparse
 import os
-from datetime import date, datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
-from dotenv import load_dotenv
-
-from cde_client import CDEApiClient
 from console_utils import (
     Colors,
     confirm_proceed,
@@ -19,36 +21,45 @@ from console_utils import (
     get_date_range_input,
     get_limit_input,
     print_data,
+    print_data_lines,
     print_error,
     print_header,
     print_info,
     print_json_preview,
+    print_record_samples,
     print_section,
     print_success,
     print_warning,
 )
-from data_utils import (
-    generate_combined_dataset_definition,
-    generate_dataset_definition,
-    generate_mrae_dataset_definition,
-    save_dataset_definition,
-    transform_faen_to_datapoints,
-    transform_generation_to_datapoints,
-    transform_mrae_to_datapoints,
-    transform_weather_to_datapoints,
-)
-from edg import (
-    EDGDataLoader,
-    EDGDatasetGenerator,
-    EDGDataTransformer,
-)
-from faen_client import FaenApiClient, create_full_day_query, create_weather_query
-from validator import DatasetValidator
 
 # Constants - default values (will be overridden by environment variables)
 SAMPLE_RECORDS_DISPLAY = 2  # Number of sample records to show
 MAX_USER_IDS_DISPLAY = 5  # Maximum number of user IDs to display
 DEFAULT_BATCH_SIZE = 500  # Default batch size for datapoint uploads
+UPLOAD_CONCURRENCY = None  # Concurrent datapoint batch uploads (None: client default)
+
+# Dataset type menu choices, and the choices that include each dataset
+_DATASET_TYPE_CHOICES = frozenset({"1", "2", "3", "4", "5", "6"})
+_CONSUMPTION_CHOICES = frozenset({"1", "3", "5"})
+_GENERATION_CHOICES = frozenset({"2", "3", "5"})
+_MRAE_CHOICES = frozenset({"4", "5"})
+_EDG_CHOICES = frozenset({"6"})
+
+# CDE generation dataset fields -> timeseries mapping keys, by field ID and by name
+_GENERATION_FIELD_IDS = {
+    "1": "generation",
+    "2": "outdoorTemperature",
+    "3": "humidity",
+}
+_GENERATION_FIELD_NAMES = {
+    "generatedEnergy": "generation",
+    "outdoorTemperature": "outdoorTemperature",
+    "humidityLevel": "humidity",
+}
+
+# JSON-LD keys read when summarizing dataset definitions
+_TIMESERIES_METADATA_KEY = "datacellar:timeSeriesMetadata"
+_DEVICE_ID_KEY = "datacellar:deviceID"
 
 # Global variable for non-interactive mode
 NON_INTERACTIVE_MODE = False
@@ -56,6 +67,8 @@ NON_INTERACTIVE_MODE = False
 
 def load_configuration():
     """Load configuration from .env files or environment variables"""
+    from dotenv import load_dotenv
+
     # Get the directory where this script is located
     script_dir = Path(__file__).parent
 
@@ -75,6 +88,80 @@ def load_configuration():
             )
 
 
+def _print_definition_summary(dataset_definition: dict, max_user_ids: int):
+    """Print the name, timeseries count and first device IDs of a dataset definition"""
+    timeseries_list = dataset_definition.get("datacellar:timeSeries", [])
+    summary = [
+        ("Dataset name", dataset_definition.get("datacellar:name", "Unknown")),
+        ("Number of timeseries", str(len(timeseries_list))),
+    ]
+
+    user_ids = [
+        str(metadata.get(_DEVICE_ID_KEY, "Unknown"))
+        for ts in timeseries_list[:max_user_ids]
+        if (metadata := ts.get(_TIMESERIES_METADATA_KEY))
+    ]
+    if user_ids:
+        remaining = len(timeseries_list) - len(user_ids)
+        suffix = f" ... (+{remaining} more)" if remaining > 0 else ""
+        summary.append(("User IDs", ", ".join(user_ids) + suffix))
+    print_data_lines(summary, 1)
+
+
+@dataclass(frozen=True)
+class Config:
+    """Settings read from .env files and environment variables"""
+
+    faen_base_url: Optional[str]
+    faen_username: str
+    faen_password: Optional[str]
+    cde_base_url: str
+    sample_records_display: int = SAMPLE_RECORDS_DISPLAY
+    max_user_ids_display: int = MAX_USER_IDS_DISPLAY
+    default_batch_size: int = DEFAULT_BATCH_SIZE
+    upload_concurrency: Optional[int] = UPLOAD_CONCURRENCY
+    verbose_mapping: bool = False
+    gzip_uploads: bool = False
+    timeseries_ttl: float = 300
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Load the .env file once and read every setting from the environment"""
+    load_configuration()
+
+    # Strip /docs from the FAEN URL if present
+    # (it's the Swagger UI URL, not the API base)
+    faen_base_url = os.getenv("FAEN_API_URL")
+    if faen_base_url:
+        api_base_url = faen_base_url.removesuffix("/docs")
+        if api_base_url != faen_base_url:
+            print_warning(f"⚠ Adjusted FAEN API URL (removed /docs): {api_base_url}")
+            faen_base_url = api_base_url
+
+    return Config(
+        faen_base_url=faen_base_url,
+        faen_username=os.getenv("FAEN_USERNAME", "datacellar.developer"),
+        faen_password=os.getenv("FAEN_PASSWORD"),
+        cde_base_url=os.getenv("CDE_API_URL", "http://localhost:5000"),
+        sample_records_display=int(
+            os.getenv("SAMPLE_RECORDS_DISPLAY", str(SAMPLE_RECORDS_DISPLAY))
+        ),
+        max_user_ids_display=int(
+            os.getenv("MAX_USER_IDS_DISPLAY", str(MAX_USER_IDS_DISPLAY))
+        ),
+        default_batch_size=int(os.getenv("DEFAULT_BATCH_SIZE", str(DEFAULT_BATCH_SIZE))),
+        upload_concurrency=(
+            int(os.environ["UPLOAD_CONCURRENCY"])
+            if os.getenv("UPLOAD_CONCURRENCY")
+            else UPLOAD_CONCURRENCY
+        ),
+        verbose_mapping="1" in (os.getenv("VERBOSE"), os.getenv("VERBOSE_MAPPING")),
+        gzip_uploads=os.getenv("CDE_GZIP_UPLOADS") == "1",
+        timeseries_ttl=float(os.getenv("CDE_TIMESERIES_TTL", "300")),
+    )
+
+
 def main():
     """Main function to demonstrate the FAEN API client with CDE integration"""
 
@@ -107,6 +194,10 @@ Examples:
 
   # With custom record limit
   python main.py --dataset-type 1 --start-date 2025-05-01 --end-date 2025-05-02 --limit 100
+
+  # Batch run that only writes the dataset definition, with a custom name
+  python main.py -y --dataset-type 1 --start-date 2025-05-01 --end-date 2025-05-02 \\
+      --dataset-name "FAEN May 2025" --no-upload
         """,
     )
 
@@ -131,10 +222,37 @@ Examples:
 
     parser.add_argument(
         "--non-interactive",
+        "-y",
+        "--yes",
         action="store_true",
         help="Run in non-interactive mode (auto-confirm all prompts)",
     )
 
+    parser.add_argument(
+        "--dataset-name",
+        type=str,
+        help="Name for the generated dataset(s) instead of the default or prompt "
+        "(the dataset type is appended when several datasets are created)",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print per-timeseries mapping details (same as VERBOSE=1)",
+    )
+
+    parser.add_argument(
+        "--force-reauth",
+        action="store_true",
+        help="Ignore the cached FAEN access token and authenticate again",
+    )
+
+    parser.add_argument(
+        "--no-upload",
+        action="store_true",
+        help="Only save dataset definitions locally (skips the CDE health check and uploads)",
+    )
+
     parser.add_argument(
         "--location",
         type=str,
@@ -183,26 +301,17 @@ Examples:
 
             # Validate date formats
             try:
-                datetime.strptime(args.start_date, "%Y-%m-%d")
-                datetime.strptime(args.end_date, "%Y-%m-%d")
+                date.fromisoformat(args.start_date)
+                date.fromisoformat(args.end_date)
             except ValueError:
                 print_error("❌ Dates must be in YYYY-MM-DD format")
                 return
 
     print_header("FAEN API ➔ CDE Integration Client")
 
-    # Load configuration
-    load_configuration()
-
-    # Load configurable constants from environment variables
-    global SAMPLE_RECORDS_DISPLAY, MAX_USER_IDS_DISPLAY, DEFAULT_BATCH_SIZE
-    SAMPLE_RECORDS_DISPLAY = int(
-        os.getenv("SAMPLE_RECORDS_DISPLAY", str(SAMPLE_RECORDS_DISPLAY))
-    )
-    MAX_USER_IDS_DISPLAY = int(
-        os.getenv("MAX_USER_IDS_DISPLAY", str(MAX_USER_IDS_DISPLAY))
-    )
-    DEFAULT_BATCH_SIZE = int(os.getenv("DEFAULT_BATCH_SIZE", str(DEFAULT_BATCH_SIZE)))
+    # Load configuration (.env file and environment variables, read once)
+    config = get_config()
+    verbose_mapping = args.verbose or config.verbose_mapping
 
     # Initial confirmation to start the process
     operation_desc = "perform dataset deletion operations" if (args.delete_dataset or args.delete_all_datasets) else "connect to FAEN API, retrieve data, and upload to CDE"
@@ -214,19 +323,34 @@ Examples:
         print_info("❌ Operation cancelled by user")
         return
 
+    # The clients and their dependencies (requests, rdflib, pyshacl) are only
+    # imported once the user has agreed to run, keeping startup fast
+    from cde_client import CDEApiClient
+    from data_utils import (
+        generate_combined_dataset_definition,
+        generate_dataset_definition,
+        generate_mrae_dataset_definition,
+        save_dataset_definition,
+        transform_faen_to_datapoints,
+        transform_generation_to_datapoints,
+        transform_mrae_to_datapoints,
+        transform_weather_to_datapoints,
+    )
+    from edg import (
+        EDGDataLoader,
+        EDGDatasetGenerator,
+        EDGDataTransformer,
+    )
+    from faen_client import FaenApiClient, create_full_day_query, create_weather_query
+    from validator import DatasetValidator
+
     print_section("⚙️ Configuration")
     # Configuration - loaded from .env file or environment variables
-    faen_base_url = os.getenv("FAEN_API_URL")
-    faen_username = os.getenv("FAEN_USERNAME", "datacellar.developer")
-    faen_password = os.getenv("FAEN_PASSWORD")
+    faen_base_url = config.faen_base_url
+    faen_username = config.faen_username
+    faen_password = config.faen_password
 
-    cde_base_url = os.getenv("CDE_API_URL", "http://localhost:5000")
-
-    # Remove /docs from the FAEN URL if present
-    # (it's the Swagger UI URL, not the API base)
-    if faen_base_url and faen_base_url.endswith("/docs"):
-        faen_base_url = faen_base_url.replace("/docs", "")
-        print_warning(f"⚠ Adjusted FAEN API URL (removed /docs): {faen_base_url}")
+    cde_base_url = config.cde_base_url
 
     if not faen_base_url:
         print_error("Please set the FAEN_API_URL environment variable")
@@ -240,41 +364,55 @@ Examples:
     print_data("FAEN Username", faen_username, 1)
     print_data("FAEN Password", "*" * len(faen_password), 1)
     print_data("CDE API URL", cde_base_url, 1)
-    print_data("Batch Size", str(DEFAULT_BATCH_SIZE), 1)
-    print_data("Sample Records Display", str(SAMPLE_RECORDS_DISPLAY), 1)
-    print_data("Max User IDs Display", str(MAX_USER_IDS_DISPLAY), 1)
+    print_data("Batch Size", str(config.default_batch_size), 1)
+    print_data("Sample Records Display", str(config.sample_records_display), 1)
+    print_data("Max User IDs Display", str(config.max_user_ids_display), 1)
 
     # Create clients
-    faen_client = FaenApiClient(faen_base_url, faen_username, faen_password)
-    cde_client = CDEApiClient(cde_base_url)
+    # Per-request and per-chunk details only with --verbose; query_all prints
+    # a record count per endpoint when it runs several queries at once
+    faen_client = FaenApiClient(
+        faen_base_url, faen_username, faen_password, verbose=verbose_mapping
+    )
+    cde_client = CDEApiClient(
+        cde_base_url,
+        compress_uploads=config.gzip_uploads,
+        upload_workers=config.upload_concurrency,
+        timeseries_ttl=config.timeseries_ttl,
+    )
+    print_data("Upload Concurrency", str(cde_client.upload_workers), 1)
+    print_data("Gzip Uploads", str(cde_client.compress_uploads), 1)
     validator = DatasetValidator()
 
     try:
         # Step 1: Check CDE API health
-        print_section("🏥 CDE Health Check")
-        health_status = cde_client.check_health()
-
-        if not health_status:
-            print_error("❌ CDE API is not accessible.")
-            print_error("❌ Cannot proceed without CDE API connection. Exiting.")
-            return
+        if args.no_upload:
+            print_info("⏭ Skipping CDE health check (--no-upload)")
         else:
-            print_data("CDE Status", health_status.get("status", "unknown"), 1)
-            print_data("CDE Version", health_status.get("version", "unknown"), 1)
-            print_data("Timestamp", health_status.get("timestamp", "unknown"), 1)
-
-            # Show service status
-            services = health_status.get("services", {})
-            for service_name, service_info in services.items():
-                status = service_info.get("status", "unknown")
-                status_emoji = (
-                    "✅"
-                    if status == "healthy"
-                    else "⚠️" if "error" not in status else "❌"
-                )
-                print_data(
-                    f"{service_name.title()} Status", f"{status_emoji} {status}", 2
-                )
+            print_section("🏥 CDE Health Check")
+            health_status = cde_client.check_health()
+
+            if not health_status:
+                print_error("❌ CDE API is not accessible.")
+                print_error("❌ Cannot proceed without CDE API connection. Exiting.")
+                return
+            else:
+                print_data("CDE Status", health_status.get("status", "unknown"), 1)
+                print_data("CDE Version", health_status.get("version", "unknown"), 1)
+                print_data("Timestamp", health_status.get("timestamp", "unknown"), 1)
+
+                # Show service status
+                services = health_status.get("services", {})
+                for service_name, service_info in services.items():
+                    status = service_info.get("status", "unknown")
+                    status_emoji = (
+                        "✅"
+                        if status == "healthy"
+                        else "⚠️" if "error" not in status else "❌"
+                    )
+                    print_data(
+                        f"{service_name.title()} Status", f"{status_emoji} {status}", 2
+                    )
 
         # Handle Deletion Requests (if any)
         if args.delete_dataset:
@@ -374,10 +512,7 @@ Examples:
             return
 
         # Step 2: Test authentication with FAEN
-        if faen_client.authenticate():
-            # Get current user info
-            user_info = faen_client.get_current_user()
-
+        if faen_client.authenticate(force=args.force_reauth):
             # Confirmation point 1: After successful authentication
             if not confirm_proceed(
                 "Authentication successful! Do you want to proceed with data "
@@ -394,10 +529,6 @@ Examples:
                 print_info(
                     f"🤖 [NON-INTERACTIVE] Using dataset type from command line: {choice}"
                 )
-                create_consumption = choice in ["1", "3", "5"]
-                create_generation = choice in ["2", "3", "5"]
-                create_mrae = choice in ["4", "5"]
-                create_edg = choice in ["6"]
             else:
                 # Interactive mode: ask user
                 print_section("📊 Dataset Type Selection")
@@ -414,17 +545,17 @@ Examples:
                 while True:
                     try:
                         choice = input("\nSelect dataset type (1-6): ").strip()
-                        if choice in ["1", "2", "3", "4", "5", "6"]:
+                        if choice in _DATASET_TYPE_CHOICES:
                             break
                         print_warning("Please enter 1, 2, 3, 4, 5, or 6")
                     except (EOFError, KeyboardInterrupt):
                         print_info("\n❌ Operation cancelled by user")
                         return
 
-                create_consumption = choice in ["1", "3", "5"]
-                create_generation = choice in ["2", "3", "5"]
-                create_mrae = choice in ["4", "5"]
-                create_edg = choice in ["6"]
+            create_consumption = choice in _CONSUMPTION_CHOICES
+            create_generation = choice in _GENERATION_CHOICES
+            create_mrae = choice in _MRAE_CHOICES
+            create_edg = choice in _EDG_CHOICES
 
             # Build selection description
             selected_types = []
@@ -443,7 +574,7 @@ Examples:
                 args.start_date, args.end_date, NON_INTERACTIVE_MODE
             )
             limit = get_limit_input(
-                DEFAULT_BATCH_SIZE if args.limit is None else 50, args.limit
+                config.default_batch_size if args.limit is None else 50, args.limit
             )
 
             print_section("📅 Final Configuration Summary")
@@ -468,39 +599,47 @@ Examples:
             mrae_data = []
             edg_data = []
 
-            # Query data based on selection
-            if create_consumption:
-                print_section("🏢 Querying Consumption Data")
-                consumption_data = faen_client.query_consumption(
-                    query=query, limit=limit, sort="+datetime"
-                )
-                print_data("Consumption records", str(len(consumption_data)), 1)
-
-            if create_generation:
-                print_section("⚡ Querying Generation Data")
-                generation_data = faen_client.query_generation(
-                    query=query, limit=limit, sort="+datetime"
-                )
-                print_data("Generation records", str(len(generation_data)), 1)
-
-                print_section("🌤️ Querying Weather Data")
-                weather_query = create_weather_query(start_date, end_date)
-                weather_data = faen_client.query_weather(
-                    query=weather_query, limit=limit, sort="+datetime_utc"
-                )
-                print_data("Weather records", str(len(weather_data)), 1)
-
-            if create_mrae:
-                print_section("🔌 Querying MRAE Charging Data")
-                location = args.location if hasattr(args, "location") else "MRA-E"
-                print_data("Location filter", location, 1)
-                mrae_data = faen_client.query_mrae(
-                    start_date=start_date.isoformat(),
-                    end_date=end_date.isoformat(),
-                    location=location,
-                    limit=limit,
+            # Query data based on selection; the FAEN endpoints are
+            # independent, so they are queried concurrently (query_all keeps
+            # their progress output from interleaving)
+            location = args.location if hasattr(args, "location") else "MRA-E"
+
+            if create_consumption or create_generation or create_mrae:
+                faen_results = faen_client.query_all(
+                    consumption=(
+                        dict(query=query, limit=limit, sort="+datetime")
+                        if create_consumption
+                        else None
+                    ),
+                    generation=(
+                        dict(query=query, limit=limit, sort="+datetime")
+                        if create_generation
+                        else None
+                    ),
+                    weather=(
+                        dict(
+                            query=create_weather_query(start_date, end_date),
+                            limit=limit,
+                            sort="+datetime_utc",
+                        )
+                        if create_generation
+                        else None
+                    ),
+                    mrae=(
+                        dict(
+                            start_date=start_date.isoformat(),
+                            end_date=end_date.isoformat(),
+                            location=location,
+                            limit=limit,
+                        )
+                        if create_mrae
+                        else None
+                    ),
                 )
-                print_data("MRAE records", str(len(mrae_data)), 1)
+                consumption_data = faen_results.get("consumption", [])
+                generation_data = faen_results.get("generation", [])
+                weather_data = faen_results.get("weather", [])
+                mrae_data = faen_results.get("mrae", [])
 
             if create_edg:
                 print_section("🇧🇬 Loading EDG West Bankya Data")
@@ -537,103 +676,35 @@ Examples:
                 print_info("❌ Operation cancelled by user")
                 return
 
+            # Decide once which datasets the retrieved data can produce
+            datasets_ready = {
+                "consumption": create_consumption and bool(consumption_data),
+                "generation": create_generation
+                and bool(generation_data)
+                and bool(weather_data),
+                "mrae": create_mrae and bool(mrae_data),
+                "edg": create_edg and bool(edg_data),
+            }
+
             # Print first few records
-            if consumption_data or generation_data or weather_data or mrae_data or edg_data:
+            if any(datasets_ready.values()):
                 print_section("📊 Sample Data")
 
-                # Show consumption data samples
-                if consumption_data:
-                    print_info("Consumption Data Sample:")
-                    for i, record in enumerate(
-                        consumption_data[:SAMPLE_RECORDS_DISPLAY]
-                    ):
-                        print(
-                            f"\n{Colors.BOLD}{Colors.MAGENTA}  Consumption Record {i+1}:"
-                            f"{Colors.RESET}"
-                        )
-                        print_json_preview(record)
-
-                    if len(consumption_data) > SAMPLE_RECORDS_DISPLAY:
-                        remaining = len(consumption_data) - SAMPLE_RECORDS_DISPLAY
-                        print(
-                            f"\n{Colors.GRAY}  ... and {remaining} more consumption records"
-                            f"{Colors.RESET}"
-                        )
-
-                # Show generation data samples
-                if generation_data:
-                    print_info("Generation Data Sample:")
-                    for i, record in enumerate(
-                        generation_data[:SAMPLE_RECORDS_DISPLAY]
-                    ):
-                        print(
-                            f"\n{Colors.BOLD}{Colors.MAGENTA}  Generation Record {i+1}:"
-                            f"{Colors.RESET}"
-                        )
-                        print_json_preview(record)
-
-                    if len(generation_data) > SAMPLE_RECORDS_DISPLAY:
-                        remaining = len(generation_data) - SAMPLE_RECORDS_DISPLAY
-                        print(
-                            f"\n{Colors.GRAY}  ... and {remaining} more generation records"
-                            f"{Colors.RESET}"
-                        )
-
-                # Show weather data samples
-                if weather_data:
-                    print_info("Weather Data Sample:")
-                    for i, record in enumerate(weather_data[:SAMPLE_RECORDS_DISPLAY]):
-                        print(
-                            f"\n{Colors.BOLD}{Colors.MAGENTA}  Weather Record {i+1}:"
-                            f"{Colors.RESET}"
-                        )
-                        print_json_preview(record)
-
-                    if len(weather_data) > SAMPLE_RECORDS_DISPLAY:
-                        remaining = len(weather_data) - SAMPLE_RECORDS_DISPLAY
-                        print(
-                            f"\n{Colors.GRAY}  ... and {remaining} more weather records"
-                            f"{Colors.RESET}"
-                        )
-
-                # Show MRAE data samples
-                if mrae_data:
-                    print_info("MRAE Charging Data Sample:")
-                    for i, record in enumerate(mrae_data[:SAMPLE_RECORDS_DISPLAY]):
-                        print(
-                            f"\n{Colors.BOLD}{Colors.MAGENTA}  MRAE Record {i+1}:"
-                            f"{Colors.RESET}"
-                        )
-                        print_json_preview(record)
-
-                    if len(mrae_data) > SAMPLE_RECORDS_DISPLAY:
-                        remaining = len(mrae_data) - SAMPLE_RECORDS_DISPLAY
-                        print(
-                            f"\n{Colors.GRAY}  ... and {remaining} more MRAE records"
-                            f"{Colors.RESET}"
-                        )
-
-                # Show EDG data samples
-                if edg_data:
-                    print_info("EDG West Bankya Data Sample:")
-                    for i, record in enumerate(edg_data[:SAMPLE_RECORDS_DISPLAY]):
-                        print(
-                            f"\n{Colors.BOLD}{Colors.MAGENTA}  EDG Record {i+1}:"
-                            f"{Colors.RESET}"
-                        )
-                        print_json_preview(record)
-
-                    if len(edg_data) > SAMPLE_RECORDS_DISPLAY:
-                        remaining = len(edg_data) - SAMPLE_RECORDS_DISPLAY
-                        print(
-                            f"\n{Colors.GRAY}  ... and {remaining} more EDG records"
-                            f"{Colors.RESET}"
-                        )
+                print_record_samples(
+                    (
+                        ("Consumption Data Sample", "Consumption", consumption_data),
+                        ("Generation Data Sample", "Generation", generation_data),
+                        ("Weather Data Sample", "Weather", weather_data),
+                        ("MRAE Charging Data Sample", "MRAE", mrae_data),
+                        ("EDG West Bankya Data Sample", "EDG", edg_data),
+                    ),
+                    config.sample_records_display,
+                )
 
                 # Generate dataset definitions based on selection
                 datasets_to_process = []
 
-                if create_consumption and consumption_data:
+                if datasets_ready["consumption"]:
                     print_section("📋 Building Consumption Dataset Generation")
                     print_info("Generating consumption dataset definition...")
 
@@ -650,17 +721,9 @@ Examples:
                     )
 
                     print_success("✓ Consumption dataset definition generated")
-                    print_data(
-                        "Dataset name",
-                        consumption_dataset.get("datacellar:name", "Unknown"),
-                        1,
-                    )
-                    timeseries_list = consumption_dataset.get(
-                        "datacellar:timeSeries", []
-                    )
-                    print_data("Number of timeseries", str(len(timeseries_list)), 1)
+                    _print_definition_summary(consumption_dataset, config.max_user_ids_display)
 
-                if create_generation and generation_data and weather_data:
+                if datasets_ready["generation"]:
                     print_section("📋 Photovoltaic Generation Dataset Generation")
                     print_info(
                         "Generating combined generation + weather dataset definition..."
@@ -682,24 +745,16 @@ Examples:
                     )
 
                     print_success("✓ Generation dataset definition generated")
-                    print_data(
-                        "Dataset name",
-                        generation_dataset.get("datacellar:name", "Unknown"),
-                        1,
-                    )
-                    timeseries_list = generation_dataset.get(
-                        "datacellar:timeSeries", []
-                    )
-                    print_data("Number of timeseries", str(len(timeseries_list)), 1)
+                    _print_definition_summary(generation_dataset, config.max_user_ids_display)
 
-                elif create_generation and (not generation_data or not weather_data):
+                elif create_generation:
                     print_warning(
                         "⚠ Cannot create generation dataset - insufficient data"
                     )
                     print_data("Generation records", str(len(generation_data)), 1)
                     print_data("Weather records", str(len(weather_data)), 1)
 
-                if create_mrae and mrae_data:
+                if datasets_ready["mrae"]:
                     print_section("📋 MRAE Charging Dataset Generation")
                     print_info(
                         "Generating MRAE charging infrastructure dataset definition..."
@@ -719,19 +774,13 @@ Examples:
                     )
 
                     print_success("✓ MRAE dataset definition generated")
-                    print_data(
-                        "Dataset name",
-                        mrae_dataset.get("datacellar:name", "Unknown"),
-                        1,
-                    )
-                    timeseries_list = mrae_dataset.get("datacellar:timeSeries", [])
-                    print_data("Number of timeseries", str(len(timeseries_list)), 1)
+                    _print_definition_summary(mrae_dataset, config.max_user_ids_display)
 
-                elif create_mrae and not mrae_data:
+                elif create_mrae:
                     print_warning("⚠ Cannot create MRAE dataset - no data available")
                     print_data("MRAE records", str(len(mrae_data)), 1)
 
-                if create_edg and edg_data:
+                if datasets_ready["edg"]:
                     print_section("📋 EDG West Bankya Dataset Generation")
                     print_info(
                         "Generating EDG West Bankya dataset definition..."
@@ -750,22 +799,12 @@ Examples:
                     )
 
                     print_success("✓ EDG dataset definition generated")
-                    print_data(
-                        "Dataset name",
-                        edg_dataset.get("datacellar:name", "Unknown"),
-                        1,
-                    )
-                    timeseries_list = edg_dataset.get("datacellar:timeSeries", [])
-                    print_data("Number of timeseries", str(len(timeseries_list)), 1)
+                    _print_definition_summary(edg_dataset, config.max_user_ids_display)
 
-                elif create_edg and not edg_data:
+                elif create_edg:
                     print_warning("⚠ Cannot create EDG dataset - no data available")
                     print_data("EDG records", str(len(edg_data)), 1)
 
-                if not datasets_to_process:
-                    print_error("❌ No datasets can be generated with available data")
-                    return
-
                 print_section("📊 Dataset Summary")
                 print_data("Total datasets to create", str(len(datasets_to_process)), 1)
                 for i, dataset_info in enumerate(datasets_to_process, 1):
@@ -786,8 +825,15 @@ Examples:
                     default_name = dataset_definition.get(
                         "datacellar:name", "FAEN Dataset"
                     )
+                    if args.dataset_name:
+                        custom_name = (
+                            args.dataset_name
+                            if len(datasets_to_process) == 1
+                            else f"{args.dataset_name} ({dataset_type})"
+                        )
+                        print_info(f"Using dataset name from command line: {custom_name}")
                     # In non-interactive mode, use default name
-                    if NON_INTERACTIVE_MODE:
+                    elif NON_INTERACTIVE_MODE:
                         custom_name = default_name
                         print_info(
                             f"🤖 [NON-INTERACTIVE] Using default dataset name: {custom_name}"
@@ -848,6 +894,15 @@ Examples:
                     # Store file path for later processing
                     dataset_info["file_path"] = dataset_file_path
 
+                if args.no_upload:
+                    print_info("⏭ Skipping CDE upload (--no-upload)")
+                    for dataset_info in datasets_to_process:
+                        if "file_path" in dataset_info:
+                            print_success(
+                                f"  • {dataset_info['name']} saved to: {dataset_info['file_path']}"
+                            )
+                    return
+
                 # Process CDE uploads
                 if not confirm_proceed(
                     f"All dataset definitions saved. Do you want to upload them to CDE?",
@@ -913,18 +968,39 @@ Examples:
                 # Upload datapoints for each successful dataset
                 print_section("📊 Uploading Datapoints to CDE")
 
-                for dataset_info in successful_uploads:
+                # Look up the timeseries of every dataset up front so the
+                # lookups for later datasets overlap the transform and upload
+                # of earlier ones. The lookups run quietly and their results
+                # are reported below, so their output does not interleave with
+                # the upload log
+                timeseries_prefetch = ThreadPoolExecutor(
+                    max_workers=len(successful_uploads)
+                )
+                timeseries_futures = [
+                    timeseries_prefetch.submit(
+                        cde_client.get_timeseries,
+                        dataset_id=dataset_info["dataset_id"],
+                        dataset_name=dataset_info["definition"].get(
+                            "datacellar:name", ""
+                        ),
+                        quiet=True,
+                    )
+                    for dataset_info in successful_uploads
+                ]
+                # Submitted lookups keep running; this only frees the threads afterwards
+                timeseries_prefetch.shutdown(wait=False)
+
+                for dataset_info, timeseries_future in zip(
+                    successful_uploads, timeseries_futures
+                ):
                     dataset_type = dataset_info["type"]
                     dataset_definition = dataset_info["definition"]
-                    dataset_id = dataset_info["dataset_id"]
                     dataset_name = dataset_definition.get("datacellar:name", "")
 
                     print_info(f"Processing datapoints for {dataset_type} dataset...")
 
                     # Get timeseries from CDE
-                    timeseries_list = cde_client.get_timeseries(
-                        dataset_id=dataset_id, dataset_name=dataset_name
-                    )
+                    timeseries_list = timeseries_future.result()
 
                     if not timeseries_list:
                         print_error(
@@ -936,14 +1012,28 @@ Examples:
 
                     # Process datapoints based on dataset type
                     if dataset_type == "consumption":
-                        # Create mapping and transform consumption data
-                        timeseries_mapping = {}
-                        for ts in timeseries_list:
-                            metadata = ts.get("timeSeriesMetadata", {})
-                            device_id = metadata.get("datacellar:deviceID")
-                            ts_id = ts.get("id")
-                            if device_id and ts_id:
-                                timeseries_mapping[str(device_id)] = ts_id
+                        # Create mapping (FAEN user ID -> timeseries ID) and transform consumption data
+                        timeseries_mapping = {
+                            str(device_id): ts["id"]
+                            for ts in timeseries_list
+                            if (
+                                device_id := ts.get("timeSeriesMetadata", {}).get(
+                                    "datacellar:deviceID"
+                                )
+                            )
+                            and ts.get("id")
+                        }
+                        if verbose_mapping:
+                            print_data_lines(
+                                (
+                                    (f"User {device_id}", ts_id)
+                                    for device_id, ts_id in timeseries_mapping.items()
+                                ),
+                                2,
+                            )
+                        print_info(
+                            f"Mapped {len(timeseries_mapping)}/{len(timeseries_list)} timeseries to FAEN users"
+                        )
 
                         if timeseries_mapping:
                             datapoints = transform_faen_to_datapoints(
@@ -962,9 +1052,11 @@ Examples:
                             field_name = dataset_field.get("datacellar:name")
                             ts_id = ts.get("id")
 
-                            print_info(f"Processing timeseries {ts_id}:")
-                            print_data("Field ID", str(field_id), 2)
-                            print_data("Field Name", str(field_name), 2)
+                            if verbose_mapping:
+                                print_info(f"Processing timeseries {ts_id}:")
+                                print_data_lines(
+                                    [("Field ID", field_id), ("Field Name", field_name)], 2
+                                )
 
                             if not field_id or not ts_id:
                                 print_warning(
@@ -972,46 +1064,26 @@ Examples:
                                 )
                                 continue
 
-                            # Map by field ID (handle both string and integer)
-                            field_id_str = str(field_id)
-                            mapped = False
-
-                            if field_id_str == "1":
-                                timeseries_mapping["generation"] = ts_id
-                                print_data("Mapped to", "generation (by ID)", 2)
-                                mapped = True
-                            elif field_id_str == "2":
-                                timeseries_mapping["outdoorTemperature"] = ts_id
-                                print_data("Mapped to", "outdoorTemperature (by ID)", 2)
-                                mapped = True
-                            elif field_id_str == "3":
-                                timeseries_mapping["humidity"] = ts_id
-                                print_data("Mapped to", "humidity (by ID)", 2)
-                                mapped = True
-
-                            # Fallback: try mapping by field name
-                            if not mapped and field_name:
-                                if field_name == "generatedEnergy":
-                                    timeseries_mapping["generation"] = ts_id
-                                    print_data("Mapped to", "generation (by name)", 2)
-                                    mapped = True
-                                elif field_name == "outdoorTemperature":
-                                    timeseries_mapping["outdoorTemperature"] = ts_id
-                                    print_data(
-                                        "Mapped to", "outdoorTemperature (by name)", 2
-                                    )
-                                    mapped = True
-                                elif field_name == "humidityLevel":
-                                    timeseries_mapping["humidity"] = ts_id
-                                    print_data("Mapped to", "humidity (by name)", 2)
-                                    mapped = True
-
-                            if not mapped:
+                            # Map by field ID (handle both string and integer),
+                            # falling back to the field name
+                            key = _GENERATION_FIELD_IDS.get(str(field_id))
+                            how = "ID"
+                            if key is None:
+                                key = _GENERATION_FIELD_NAMES.get(field_name)
+                                how = "name"
+
+                            if key is not None:
+                                timeseries_mapping[key] = ts_id
+                                if verbose_mapping:
+                                    print_data("Mapped to", f"{key} (by {how})", 2)
+                            else:
                                 print_warning(
                                     f"⚠ Could not map timeseries {ts_id} (ID: {field_id}, Name: {field_name})"
                                 )
 
-                        print_info(f"Final timeseries mapping: {timeseries_mapping}")
+                        print_info(
+                            f"Mapped {len(timeseries_mapping)}/{len(timeseries_list)} timeseries: {timeseries_mapping}"
+                        )
 
                         # Validate we have all required mappings
                         expected_mappings = [
@@ -1028,17 +1100,18 @@ Examples:
                             )
 
                         if timeseries_mapping:
-                            # Transform generation data
-                            generation_datapoints = transform_generation_to_datapoints(
+                            # Transform generation data, then append the weather
+                            # datapoints in place instead of copying both lists
+                            datapoints = transform_generation_to_datapoints(
                                 dataset_info["data"]["generation"], timeseries_mapping
                             )
-                            # Transform weather data
-                            weather_datapoints = transform_weather_to_datapoints(
-                                dataset_info["data"]["weather"],
-                                timeseries_mapping.get("outdoorTemperature"),
-                                timeseries_mapping.get("humidity"),
+                            datapoints.extend(
+                                transform_weather_to_datapoints(
+                                    dataset_info["data"]["weather"],
+                                    timeseries_mapping.get("outdoorTemperature"),
+                                    timeseries_mapping.get("humidity"),
+                                )
                             )
-                            datapoints = generation_datapoints + weather_datapoints
                         else:
                             datapoints = []
 
@@ -1057,9 +1130,11 @@ Examples:
                             field_name = dataset_field.get("datacellar:name")
                             ts_id = ts.get("id")
 
-                            print_info(f"Processing MRAE timeseries {ts_id}:")
-                            print_data("Field ID", str(field_id), 2)
-                            print_data("Field Name", str(field_name), 2)
+                            if verbose_mapping:
+                                print_info(f"Processing MRAE timeseries {ts_id}:")
+                                print_data_lines(
+                                    [("Field ID", field_id), ("Field Name", field_name)], 2
+                                )
 
                             if not field_id or not ts_id:
                                 print_warning(
@@ -1070,14 +1145,15 @@ Examples:
                             # Map by field ID
                             if field_id in field_map:
                                 timeseries_mapping[field_map[field_id]] = ts_id
-                                print_data(
-                                    "Mapped to", f"{field_map[field_id]} → {ts_id}", 2
-                                )
+                                if verbose_mapping:
+                                    print_data(
+                                        "Mapped to", f"{field_map[field_id]} → {ts_id}", 2
+                                    )
                             else:
                                 print_warning(f"⚠ Unknown field ID: {field_id}")
 
                         print_info(
-                            f"Final MRAE timeseries mapping: {timeseries_mapping}"
+                            f"Mapped {len(timeseries_mapping)}/{len(timeseries_list)} MRAE timeseries: {timeseries_mapping}"
                         )
 
                         # Validate we have all required mappings
@@ -1124,7 +1200,7 @@ Examples:
                         # Upload datapoints in batches
                         batch_result = cde_client.add_datapoints_batch(
                             datapoints,
-                            batch_size=DEFAULT_BATCH_SIZE,
+                            batch_size=config.default_batch_size,
                             dataset_name=dataset_name,
                             start_date=str(start_date),
                             end_date=str(end_date)
@@ -1136,6 +1212,10 @@ Examples:
                             "Successfully uploaded", str(batch_result["success"]), 2
                         )
                         print_data("Failed uploads", str(batch_result["failed"]), 2)
+                        if batch_result["duplicates"]:
+                            print_data(
+                                "Skipped duplicates", str(batch_result["duplicates"]), 2
+                            )
 
                         if batch_result["success"] > 0:
                             success_rate = (
@@ -1181,8 +1261,7 @@ Examples:
                         f"✓ Successfully uploaded {len(successful_uploads)} dataset(s) to CDE"
                     )
 
-                    total_datapoints_uploaded = 0
-                    total_datapoints_failed = 0
+                    datapoint_totals = Counter()
 
                     for dataset_info in successful_uploads:
                         dataset_type = dataset_info["type"]
@@ -1190,8 +1269,7 @@ Examples:
                             result = dataset_info["datapoint_result"]
                             success_count = result["success"]
                             failed_count = result["failed"]
-                            total_datapoints_uploaded += success_count
-                            total_datapoints_failed += failed_count
+                            datapoint_totals.update(result)
 
                             print_success(
                                 f"  • {dataset_type.title()}: {success_count} datapoints uploaded"
@@ -1199,6 +1277,8 @@ Examples:
                             if failed_count > 0:
                                 print_warning(f"    ⚠ {failed_count} datapoints failed")
 
+                    total_datapoints_uploaded = datapoint_totals["success"]
+                    total_datapoints_failed = datapoint_totals["failed"]
                     if total_datapoints_uploaded > 0:
                         print_success(
                             f"✓ Total datapoints uploaded: {total_datapoints_uploaded}"
@@ -1222,7 +1302,12 @@ Examples:
                     )
 
             else:
-                print_warning("⚠ No data found for the specified date range")
+                if create_generation and (generation_data or weather_data):
+                    print_warning(
+                        "⚠ Cannot create generation dataset - insufficient data"
+                    )
+                else:
+                    print_warning("⚠ No data found for the specified date range")
                 print_info("❌ Cannot proceed without data. Exiting.")
                 return
 
@@ -1240,6 +1325,9 @@ Examples:
     except Exception as e:
         print_error(f"❌ Error: {e}")
         return
+    finally:
+        faen_client.close()
+        cde_client.close()
 
 
 if __name__ == "__main__":
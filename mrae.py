@@ -18,8 +18,10 @@ from urllib.parse import urljoin
 
 import requests
 
+import json_utils
 from console_utils import (
     print_data,
+    print_data_lines,
     print_error,
     print_info,
     print_section,
@@ -31,16 +33,18 @@ from console_utils import (
 class MRAEClient:
     """Client for interacting with MRAE charging infrastructure endpoints"""
 
-    def __init__(self, session: requests.Session, base_url: str):
+    def __init__(self, session: requests.Session, base_url: str, verbose: bool = True):
         """
         Initialize the MRAE client
 
         Args:
             session: Authenticated requests session
             base_url: Base URL of the FAEN API
+            verbose: Print query progress (errors are always printed)
         """
         self.session = session
         self.base_url = base_url.rstrip("/")
+        self.verbose = verbose
 
     def query_mrae(
         self,
@@ -61,33 +65,39 @@ class MRAEClient:
         Returns:
             List of MRAE charging infrastructure records
         """
-        print_section("🔌 Querying MRAE Charging Data")
         mrae_url = urljoin(self.base_url + "/", "mrae/")
-        print_data("Endpoint", mrae_url, 1)
 
         # Build query parameters
         params = {}
         if start_date:
             params["start_date"] = start_date
-            print_data("Start date", start_date, 1)
         if end_date:
             params["end_date"] = end_date
-            print_data("End date", end_date, 1)
         if location:
             params["location"] = location
-            print_data("Location", location, 1)
         if limit:
             params["limit"] = limit
-            print_data("Limit", str(limit), 1)
 
-        try:
+        if self.verbose:
+            print_section("🔌 Querying MRAE Charging Data")
+            print_data("Endpoint", mrae_url, 1)
+            labels = {
+                "start_date": "Start date",
+                "end_date": "End date",
+                "location": "Location",
+                "limit": "Limit",
+            }
+            print_data_lines(((labels[key], value) for key, value in params.items()), 1)
             print_info("Sending query request...")
+
+        try:
             response = self.session.get(mrae_url, params=params)
             response.raise_for_status()
 
-            data = response.json()
-            record_count = len(data) if isinstance(data, list) else 1
-            print_success(f"✓ Retrieved {record_count} MRAE records")
+            data = json_utils.response_json(response)
+            if self.verbose:
+                record_count = len(data) if isinstance(data, list) else 1
+                print_success(f"✓ Retrieved {record_count} MRAE records")
             return data
 
         except requests.exceptions.RequestException as e:
@@ -113,7 +123,7 @@ class MRAEClient:
             response = self.session.get(stats_url)
             response.raise_for_status()
 
-            stats = response.json()
+            stats = json_utils.response_json(response)
             print_success("✓ MRAE statistics retrieved")
 
             # Display key statistics
@@ -149,7 +159,7 @@ class MRAEClient:
             response = self.session.get(summary_url)
             response.raise_for_status()
 
-            data = response.json()
+            data = json_utils.response_json(response)
             record_count = len(data) if isinstance(data, list) else 1
             print_success(f"✓ Retrieved {record_count} monthly records for {year}")
             return data
@@ -5,6 +5,7 @@ Test script for combined dataset creation (generation + weather)
 
 import os
 import json
+from collections import Counter
 from datetime import date
 from dotenv import load_dotenv
 
@@ -47,15 +48,19 @@ def test_combined_dataset():
             print_error("Authentication failed!")
             return False
         
-        print_section("⚡ Fetching Generation Data")
+        print_section("⚡ Fetching Generation and Weather Data")
         generation_query = create_full_day_query(start_date, end_date)
-        print_data("Query", str(generation_query), 1)
+        weather_query = create_weather_query(start_date, end_date)
+        print_data("Generation query", str(generation_query), 1)
+        print_data("Weather query", str(weather_query), 1)
         
-        generation_data = client.query_generation(
-            query=generation_query,
-            limit=200,
-            sort="+datetime"
+        # The two endpoints are independent, so query them concurrently
+        results = client.query_all(
+            generation=dict(query=generation_query, limit=200, sort="+datetime"),
+            weather=dict(query=weather_query, limit=200, sort="+datetime_utc")
         )
+        generation_data = results["generation"]
+        weather_data = results["weather"]
         
         print_success(f"✓ Retrieved {len(generation_data)} generation records")
         if generation_data:
@@ -63,16 +68,6 @@ def test_combined_dataset():
             print_data("Sample user_id", sample.get('user_id', 'N/A'), 1)
             print_data("Sample generation_kwh", sample.get('data', {}).get('generation_kwh', 'N/A'), 1)
         
-        print_section("🌤️ Fetching Weather Data")
-        weather_query = create_weather_query(start_date, end_date)
-        print_data("Query", str(weather_query), 1)
-        
-        weather_data = client.query_weather(
-            query=weather_query,
-            limit=200,
-            sort="+datetime_utc"
-        )
-        
         print_success(f"✓ Retrieved {len(weather_data)} weather records")
         if weather_data:
             sample = weather_data[0]
@@ -95,10 +90,7 @@ def test_combined_dataset():
         print_data("Number of dataset fields", len(dataset_definition.get("datacellar:datasetSelfDescription", {}).get("datacellar:datasetFields", [])), 1)
         
         # Show datapoint breakdown
-        measurement_counts = {}
-        for dp in all_datapoints:
-            measurement = dp.get("measurement", "unknown")
-            measurement_counts[measurement] = measurement_counts.get(measurement, 0) + 1
+        measurement_counts = Counter(dp.get("measurement", "unknown") for dp in all_datapoints)
         
         print_info("Datapoint breakdown:")
         for measurement, count in measurement_counts.items():
@@ -117,8 +109,14 @@ def test_combined_dataset():
         
         # Show sample datapoints
         print_section("📊 Sample Datapoints")
-        for measurement in measurement_counts.keys():
-            sample_dp = next((dp for dp in all_datapoints if dp.get("measurement") == measurement), None)
+        # First datapoint of each measurement, found in one pass that stops
+        # once every measurement has a sample
+        samples = {}
+        for dp in all_datapoints:
+            samples.setdefault(dp.get("measurement", "unknown"), dp)
+            if len(samples) == len(measurement_counts):
+                break
+        for measurement, sample_dp in samples.items():
             if sample_dp:
                 print_info(f"Sample {measurement} datapoint:")
                 print_data("Value", f"{sample_dp.get('value')} {sample_dp.get('unit')}", 2)
@@ -1,10 +1,10 @@
-import json
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
 import rdflib
 from pyshacl import validate
 
+import json_utils
 from console_utils import print_warning
 
 
@@ -56,7 +56,7 @@ class DatasetValidator:
             # A more robust approach for this specific setup where we have the schema locally:
             # We can try to parse it.
 
-            json_data = json.dumps(dataset_definition)
+            json_data = json_utils.dumps(dataset_definition).decode("utf-8")
             data_graph.parse(data=json_data, format="json-ld")
 
             # Load SHACL shapes